@@ -59,6 +59,18 @@ class Config:
     # - Do NOT schedule at :00 or :30 (peak times)
     SPACETRACK_URL = "https://www.space-track.org"
 
+    # On-disk cache for Space-Track responses (GP_HISTORY, SATCAT, announcements)
+    SPACETRACK_CACHE_PATH = os.environ.get(
+        "SPACETRACK_CACHE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "spacetrack_cache.db"),
+    )
+
+    # Persisted Space-Track login cookies (one jar per account, reused across restarts)
+    SPACETRACK_COOKIE_DIR = os.environ.get(
+        "SPACETRACK_COOKIE_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "spacetrack_cookies"),
+    )
+
     # Multi-account pool for rate limit management and failover
     # Accounts are rotated to stay within API limits
     # All accounts registered at space-track.org
@@ -0,0 +1,35 @@
+"""Make the tle_history (satellite_id, epoch) index unique
+
+Revision ID: 4e9b2f7c1d36
+Revises: 7c3e51a9d2b4
+Create Date: 2026-10-16 21:05:47.905214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e9b2f7c1d36'
+down_revision = '7c3e51a9d2b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # GP updates could store an epoch the backfill already had; keep the oldest row
+    op.execute(
+        "DELETE FROM tle_history WHERE id NOT IN ("
+        "SELECT id FROM (SELECT MIN(id) AS id FROM tle_history "
+        "GROUP BY satellite_id, epoch) AS keep)"
+    )
+
+    with op.batch_alter_table('tle_history', schema=None) as batch_op:
+        batch_op.drop_index('ix_tle_history_satellite_id_epoch')
+        batch_op.create_index('ix_tle_history_satellite_id_epoch', ['satellite_id', 'epoch'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('tle_history', schema=None) as batch_op:
+        batch_op.drop_index('ix_tle_history_satellite_id_epoch')
+        batch_op.create_index('ix_tle_history_satellite_id_epoch', ['satellite_id', 'epoch'], unique=False)
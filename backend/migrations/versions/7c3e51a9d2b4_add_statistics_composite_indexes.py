@@ -0,0 +1,34 @@
+"""Add composite indexes for statistics queries
+
+Revision ID: 7c3e51a9d2b4
+Revises: 1a8d97c5cef0
+Create Date: 2026-10-16 20:30:12.418203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e51a9d2b4'
+down_revision = '1a8d97c5cef0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('satellites', schema=None) as batch_op:
+        batch_op.create_index('ix_satellites_constellation_id_is_active', ['constellation_id', 'is_active'], unique=False)
+        batch_op.create_index('ix_satellites_constellation_id_decay_date', ['constellation_id', 'decay_date'], unique=False)
+
+    with op.batch_alter_table('tle_history', schema=None) as batch_op:
+        batch_op.create_index('ix_tle_history_satellite_id_epoch', ['satellite_id', 'epoch'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tle_history', schema=None) as batch_op:
+        batch_op.drop_index('ix_tle_history_satellite_id_epoch')
+
+    with op.batch_alter_table('satellites', schema=None) as batch_op:
+        batch_op.drop_index('ix_satellites_constellation_id_decay_date')
+        batch_op.drop_index('ix_satellites_constellation_id_is_active')
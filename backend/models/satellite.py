@@ -10,6 +10,11 @@ class Satellite(db.Model):
     Represents an individual satellite with its TLE data and orbital parameters.
     """
     __tablename__ = 'satellites'
+    __table_args__ = (
+        # Statistics queries filter by constellation, then by status / decay date
+        db.Index('ix_satellites_constellation_id_is_active', 'constellation_id', 'is_active'),
+        db.Index('ix_satellites_constellation_id_decay_date', 'constellation_id', 'decay_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     norad_id = db.Column(db.Integer, unique=True, nullable=False, index=True)
@@ -10,6 +10,11 @@ class TLEHistory(db.Model):
     Stores historical TLE data for analyzing orbital decay and changes over time.
     """
     __tablename__ = 'tle_history'
+    __table_args__ = (
+        # Per-satellite history ordered by epoch (decay charts, first-epoch lookups).
+        # Unique so history inserts can skip already stored epochs with ON CONFLICT.
+        db.Index('ix_tle_history_satellite_id_epoch', 'satellite_id', 'epoch', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     satellite_id = db.Column(db.Integer, db.ForeignKey('satellites.id'), nullable=False, index=True)
@@ -641,6 +641,7 @@ def fetch_tle_from_external(slug):
         tle_data = response.json()
         
         updated_count = 0
+        parsed = []
         for sat in satellites_without_tle:
             sat_tle = tle_data.get(str(sat.norad_id))
             if sat_tle and 'line1' in sat_tle and 'line2' in sat_tle:
@@ -655,11 +656,28 @@ def fetch_tle_from_external(slug):
                     sat.eccentricity = float('0.' + line2[26:33].strip())
                     sat.mean_motion = float(line2[52:63].strip())
                     sat.period_minutes = 1440.0 / sat.mean_motion
+                    parsed.append(sat)
                 except (ValueError, IndexError):
                     pass
                 
                 updated_count += 1
         
+        # Derive the remaining elements for the whole batch now, so they are
+        # stored with the TLE instead of left empty
+        if parsed:
+            elements = tle_service.compute_orbital_elements(
+                [sat.mean_motion for sat in parsed],
+                [sat.eccentricity for sat in parsed],
+            )
+            for sat, semi_major_axis, apogee, perigee in zip(
+                    parsed,
+                    elements['semi_major_axis_km'].tolist(),
+                    elements['apogee_km'].tolist(),
+                    elements['perigee_km'].tolist()):
+                sat.semi_major_axis_km = semi_major_axis
+                sat.apogee_km = apogee
+                sat.perigee_km = perigee
+        
         db.session.commit()
         
         return jsonify({
@@ -400,20 +400,21 @@ def get_all_tle():
     Query parameters:
     - constellation: Filter by constellation slug
     """
-    constellation_slug = request.args.get('constellation')
+    from services.tle_service import tle_service
     
-    query = Satellite.query
+    constellation_slug = request.args.get('constellation')
+    constellation_id = None
     
     if constellation_slug:
-        constellation = Constellation.query.filter_by(slug=constellation_slug).first()
-        if constellation:
-            query = query.filter_by(constellation_id=constellation.id)
-        else:
+        constellation_id = db.session.query(Constellation.id)\
+            .filter_by(slug=constellation_slug)\
+            .scalar()
+        if constellation_id is None:
             return jsonify({'error': 'Constellation not found'}), 404
     
-    satellites = query.all()
+    satellites = tle_service.get_all_tle(constellation_id)
     
     return jsonify({
         'count': len(satellites),
-        'satellites': [sat.to_tle_dict() for sat in satellites]
+        'satellites': satellites
     })
@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify, request
 from services.statistics_service import statistics_service
 from services.tle_service import tle_service
 from config import Config
+from utils.response_util import streamed_json_array
 
 statistics_bp = Blueprint('statistics', __name__, url_prefix='/api/statistics')
 
@@ -28,7 +29,7 @@ def ensure_constellation_data(slug):
     - days: Number of days of history to fetch (default: 3 years = 1095)
     - max_batches: Maximum batches to process (default: 10, use 0 for unlimited)
     """
-    from models import Constellation, Satellite
+    from models import db, Constellation, Satellite
     
     if slug not in Config.CONSTELLATIONS:
         return jsonify({'error': 'Constellation not found'}), 404
@@ -42,10 +43,10 @@ def ensure_constellation_data(slug):
     catalog_result = tle_service.sync_catalog_from_spacetrack(slug)
     
     # 2. Get current satellite count
-    constellation = Constellation.query.filter_by(slug=slug).first()
+    constellation_id = db.session.query(Constellation.id).filter_by(slug=slug).scalar()
     sat_count = 0
-    if constellation:
-        sat_count = Satellite.query.filter_by(constellation_id=constellation.id).count()
+    if constellation_id is not None:
+        sat_count = Satellite.query.filter_by(constellation_id=constellation_id).count()
     
     # 3. Incremental history backfill (rate-limit compliant)
     history_result = tle_service.sync_constellation_history(
@@ -53,6 +54,7 @@ def ensure_constellation_data(slug):
         days=days,
         max_batches=max_batches
     )
+    statistics_service.invalidate_cache(slug)
 
     return jsonify({
         'status': 'ok',
@@ -110,10 +112,9 @@ def constellation_growth(slug):
 def constellation_decays(slug):
     """Get decay history."""
     data = statistics_service.get_decay_history(slug)
-    return jsonify(data)
+    return streamed_json_array(data)
 
 @statistics_bp.route('/satellite/<int:norad_id>/decay', methods=['GET'])
 def satellite_decay(norad_id):
     """Get orbital decay history for a specific satellite."""
-    data = statistics_service.get_orbital_decay(norad_id)
-    return jsonify(data)
+    return streamed_json_array(statistics_service.iter_orbital_decay(norad_id))
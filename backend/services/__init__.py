@@ -4,6 +4,7 @@ Business logic services for the Satellite Tracker.
 Services:
 - account_pool: Space-Track multi-account management
 - spacetrack_service: Space-Track.org API interactions
+- spacetrack_cache: On-disk Space-Track response cache
 - tle_service: TLE data management
 - statistics_service: Statistics calculations
 - launch_service: Launch data management
@@ -13,7 +14,8 @@ Services:
 """
 
 from .account_pool import AccountPoolManager, init_account_pool, get_account_pool, QueryType
-from .spacetrack_service import SpaceTrackService, spacetrack_service
+from .spacetrack_cache import SpaceTrackCache
+from .spacetrack_service import SpaceTrackService, spacetrack_service, get_spacetrack_service
 from .tle_service import TLEService, tle_service
 from .statistics_service import StatisticsService, statistics_service
 from .launch_service import LaunchService, launch_service
@@ -37,6 +39,8 @@ __all__ = [
     # Space-Track
     'SpaceTrackService',
     'spacetrack_service',
+    'get_spacetrack_service',
+    'SpaceTrackCache',
     
     # TLE
     'TLEService',
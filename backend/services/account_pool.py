@@ -22,6 +22,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
+from config import Config
+
 
 class AccountStatus(Enum):
     """Account status enumeration"""
@@ -463,6 +465,7 @@ class AccountPoolManager:
 
 # Singleton instance (will be initialized with config)
 account_pool: Optional[AccountPoolManager] = None
+_account_pool_lock = threading.Lock()
 
 
 def init_account_pool(accounts: List[Dict[str, str]]) -> AccountPoolManager:
@@ -473,8 +476,10 @@ def init_account_pool(accounts: List[Dict[str, str]]) -> AccountPoolManager:
 
 
 def get_account_pool() -> AccountPoolManager:
-    """Get the global account pool instance."""
+    """Get the global account pool instance, initializing it from config on first use."""
     global account_pool
     if account_pool is None:
-        raise RuntimeError("Account pool not initialized. Call init_account_pool() first.")
+        with _account_pool_lock:
+            if account_pool is None:
+                account_pool = AccountPoolManager(Config.SPACETRACK_ACCOUNTS)
     return account_pool
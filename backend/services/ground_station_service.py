@@ -15,6 +15,7 @@ Primary sources:
 import os
 import json
 import requests
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 from threading import Lock
@@ -55,14 +56,12 @@ class GroundStationService:
     def _check_rate_limit(self, key: str) -> bool:
         """Check if we can sync."""
         with self._rate_limit_lock:
-            import time
             last_time = self._last_sync_time.get(key, 0)
             return time.time() - last_time >= self.SYNC_RATE_LIMIT
     
     def _update_rate_limit(self, key: str):
         """Update last sync time."""
         with self._rate_limit_lock:
-            import time
             self._last_sync_time[key] = time.time()
     
     def get_constellation_stations(self, slug: str) -> List[Dict]:
@@ -75,12 +74,12 @@ class GroundStationService:
         Returns:
             List of ground station dictionaries
         """
-        constellation = Constellation.query.filter_by(slug=slug).first()
-        if not constellation:
+        constellation_id = db.session.query(Constellation.id).filter_by(slug=slug).scalar()
+        if constellation_id is None:
             return []
         
         stations = GroundStation.query.filter_by(
-            constellation_id=constellation.id,
+            constellation_id=constellation_id,
             is_active=True
         ).all()
         
@@ -88,12 +87,12 @@ class GroundStationService:
     
     def get_station_count(self, slug: str) -> int:
         """Get count of ground stations for a constellation."""
-        constellation = Constellation.query.filter_by(slug=slug).first()
-        if not constellation:
+        constellation_id = db.session.query(Constellation.id).filter_by(slug=slug).scalar()
+        if constellation_id is None:
             return 0
         
         return GroundStation.query.filter_by(
-            constellation_id=constellation.id,
+            constellation_id=constellation_id,
             is_active=True
         ).count()
     
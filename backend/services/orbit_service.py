@@ -5,6 +5,7 @@ Provides server-side orbit prediction capabilities.
 import math
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
+import numpy as np
 from sgp4.api import Satrec, jday
 from sgp4.api import WGS72
 
@@ -54,25 +55,77 @@ class OrbitService:
                 # Propagation error
                 return None
             
-            # r is in km (ECI coordinates), v is in km/s
-            x, y, z = r
-            vx, vy, vz = v
+            return self._position_dict(r, v, jd, fr, time)
+        except Exception as e:
+            print(f"Error propagating satellite: {e}")
+            return None
+    
+    def _propagate_times(
+        self,
+        tle_line1: str,
+        tle_line2: str,
+        times: List[datetime]
+    ) -> List[Optional[Dict]]:
+        """
+        Propagate one satellite over many times with a single sgp4_array call.
+        
+        The TLE is parsed once and the C++ propagator runs over all epochs,
+        instead of re-parsing and propagating per time step.
+        
+        Args:
+            tle_line1: TLE line 1
+            tle_line2: TLE line 2
+            times: DateTimes for position calculation
             
-            # Convert ECI to geodetic (lat, lon, alt)
-            lat, lon, alt = self._eci_to_geodetic(x, y, z, jd + fr)
+        Returns:
+            List aligned with times; None where propagation failed
+        """
+        if not times:
+            return []
+        
+        try:
+            satellite = Satrec.twoline2rv(tle_line1, tle_line2)
             
-            return {
-                'latitude': lat,
-                'longitude': lon,
-                'altitude_km': alt,
-                'velocity_km_s': math.sqrt(vx**2 + vy**2 + vz**2),
-                'position_eci': {'x': x, 'y': y, 'z': z},
-                'velocity_eci': {'x': vx, 'y': vy, 'z': vz},
-                'time': time.isoformat(),
-            }
+            jd = np.empty(len(times))
+            fr = np.empty(len(times))
+            for i, t in enumerate(times):
+                jd[i], fr[i] = jday(
+                    t.year, t.month, t.day,
+                    t.hour, t.minute, t.second + t.microsecond / 1e6
+                )
+            
+            e, r, v = satellite.sgp4_array(jd, fr)
         except Exception as e:
             print(f"Error propagating satellite: {e}")
-            return None
+            return [None] * len(times)
+        
+        jd = jd.tolist()
+        fr = fr.tolist()
+        r = r.tolist()
+        v = v.tolist()
+        return [
+            self._position_dict(r[i], v[i], jd[i], fr[i], t) if not e[i] else None
+            for i, t in enumerate(times)
+        ]
+    
+    def _position_dict(self, r, v, jd: float, fr: float, time: datetime) -> Dict:
+        """Build the position dictionary for one propagated state vector."""
+        # r is in km (ECI coordinates), v is in km/s
+        x, y, z = r
+        vx, vy, vz = v
+        
+        # Convert ECI to geodetic (lat, lon, alt)
+        lat, lon, alt = self._eci_to_geodetic(x, y, z, jd + fr)
+        
+        return {
+            'latitude': lat,
+            'longitude': lon,
+            'altitude_km': alt,
+            'velocity_km_s': math.hypot(vx, vy, vz),
+            'position_eci': {'x': x, 'y': y, 'z': z},
+            'velocity_eci': {'x': vx, 'y': vy, 'z': vz},
+            'time': time.isoformat(),
+        }
     
     def _eci_to_geodetic(
         self,
@@ -111,11 +164,11 @@ class OrbitService:
         lon = math.degrees(math.atan2(y_ecef, x_ecef))
         
         # Iterative calculation for latitude
-        r_xy = math.sqrt(x_ecef**2 + y_ecef**2)
+        r_xy = math.hypot(x_ecef, y_ecef)
         lat = math.degrees(math.atan2(z_ecef, r_xy))
         
         # Calculate altitude
-        r = math.sqrt(x_ecef**2 + y_ecef**2 + z_ecef**2)
+        r = math.hypot(x_ecef, y_ecef, z_ecef)
         alt = r - self.EARTH_RADIUS_KM
         
         return lat, lon, alt
@@ -141,17 +194,16 @@ class OrbitService:
         Returns:
             List of position dictionaries
         """
-        positions = []
+        times = []
         current_time = start_time
         end_time = start_time + timedelta(minutes=duration_minutes)
         
         while current_time <= end_time:
-            pos = self.propagate_satellite(tle_line1, tle_line2, current_time)
-            if pos:
-                positions.append(pos)
+            times.append(current_time)
             current_time += timedelta(seconds=step_seconds)
         
-        return positions
+        positions = self._propagate_times(tle_line1, tle_line2, times)
+        return [pos for pos in positions if pos]
     
     def predict_passes(
         self,
@@ -184,17 +236,21 @@ class OrbitService:
             start_time = datetime.utcnow()
         
         passes = []
+        times = []
         current_time = start_time
         end_time = start_time + timedelta(days=days)
         step = timedelta(seconds=60)
         
+        while current_time <= end_time:
+            times.append(current_time)
+            current_time += step
+        
         in_pass = False
         pass_data = {}
         max_elevation = 0
         
-        while current_time <= end_time:
-            pos = self.propagate_satellite(tle_line1, tle_line2, current_time)
-            
+        positions = self._propagate_times(tle_line1, tle_line2, times)
+        for current_time, pos in zip(times, positions):
             if pos:
                 elevation = self._calculate_elevation(
                     pos['latitude'], pos['longitude'], pos['altitude_km'],
@@ -230,8 +286,6 @@ class OrbitService:
                     passes.append(pass_data)
                     pass_data = {}
                     max_elevation = 0
-            
-            current_time += step
         
         return passes
     
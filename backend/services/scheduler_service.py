@@ -38,6 +38,7 @@ def update_gp_data_job():
     
     Space-Track compliant: Uses account pool rotation and rate limiting.
     """
+    from services.statistics_service import statistics_service
     from services.tle_service import tle_service
     from app import app
     
@@ -59,6 +60,7 @@ def update_gp_data_job():
             
             update_stats['last_update'] = timestamp
             update_stats['total_updates'] += 1
+            statistics_service.invalidate_cache()
             
             print(f"  Total: {total_new} new, {total_updated} updated")
             
@@ -76,6 +78,7 @@ def sync_satcat_job():
     
     SATCAT provides launch dates, decay dates, and satellite metadata.
     """
+    from services.statistics_service import statistics_service
     from services.tle_service import tle_service
     from app import app
     
@@ -96,6 +99,7 @@ def sync_satcat_job():
                         print(f"  {slug}: error - {e}")
             
             update_stats['last_satcat_sync'] = timestamp
+            statistics_service.invalidate_cache()
             
         except Exception as e:
             print(f"[Scheduler] SATCAT sync error: {e}")
@@ -115,6 +119,7 @@ def backfill_history_job():
     
     Target: 3 years of history for all constellations.
     """
+    from services.statistics_service import statistics_service
     from services.tle_service import tle_service
     from app import app
     
@@ -164,6 +169,7 @@ def backfill_history_job():
                     print(f"  {slug}: history error - {e}")
             
             update_stats['last_history_backfill'] = timestamp
+            statistics_service.invalidate_cache()
             
         except Exception as e:
             print(f"[Scheduler] History backfill error: {e}")
@@ -252,6 +258,20 @@ def check_account_pool_health():
         print(f"[Scheduler] Account pool check error: {e}")
 
 
+def purge_spacetrack_cache_job():
+    """
+    Background job to drop expired Space-Track responses from the on-disk cache.
+    Never-expiring GP_HISTORY entries are kept.
+    """
+    from services.spacetrack_service import spacetrack_service
+    
+    try:
+        removed = spacetrack_service.response_cache.delete_expired()
+        print(f"[Scheduler] Purged {removed} expired Space-Track cache entries")
+    except Exception as e:
+        print(f"[Scheduler] Cache purge error: {e}")
+
+
 def get_scheduler_status():
     """Get current scheduler status and statistics."""
     return {
@@ -283,6 +303,7 @@ def initialize_scheduler(app):
     - Launch Data: Every 12 hours at :17
     - Ground Stations: Weekly at Sunday 12:47
     - Account Health: Every hour at :47
+    - Cache Purge: Weekly at Sunday 13:07
     """
     
     # GP data update - every 6 hours at :17
@@ -351,6 +372,18 @@ def initialize_scheduler(app):
         replace_existing=True
     )
     
+    # Space-Track response cache purge - weekly on Sunday at 13:07
+    scheduler.add_job(
+        purge_spacetrack_cache_job,
+        'cron',
+        day_of_week='sun',
+        hour=13,
+        minute=7,
+        timezone='utc',
+        id='spacetrack_cache_purge',
+        replace_existing=True
+    )
+    
     scheduler.start()
     
     print(f"[Scheduler] Started with Space-Track compliant schedule:")
@@ -360,6 +393,7 @@ def initialize_scheduler(app):
     print(f"  - Launch Enrichment: every 12h at :17 UTC")
     print(f"  - Ground Stations: weekly Sunday 12:47 UTC")
     print(f"  - Account Health: every hour at :47 UTC")
+    print(f"  - Cache Purge: weekly Sunday 13:07 UTC")
 
 
 def shutdown_scheduler():
@@ -0,0 +1,209 @@
+"""
+Space-Track Response Cache
+
+Persistent on-disk TTL cache for Space-Track query responses, keyed by
+query URL, plus a row-level store of GP_HISTORY records keyed by
+(NORAD_CAT_ID, EPOCH) and selected by CREATION_DATE, the same field the
+GP_HISTORY queries filter on. Backed by a local SQLite file so cached
+data survives restarts.
+
+USAGE POLICY COMPLIANCE:
+- GP_HISTORY: Download once per satellite lifetime -> never expires
+- GP: 1 query per hour -> expires after 1 hour
+- SATCAT: 1 query per day -> expires after 24 hours
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import orjson
+
+
+class SpaceTrackCache:
+    """
+    SQLite-backed TTL cache for decoded Space-Track JSON responses.
+
+    A TTL of None means the entry never expires.
+
+    GP_HISTORY records are also kept per row together with the date range
+    each satellite has been downloaded for, so overlapping NORAD ID lists
+    only fetch the satellites that are actually missing.
+    """
+
+    # Max bound parameters per IN (...) clause (SQLite default limit is 999)
+    MAX_SQL_PARAMS = 500
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Filesystem path of the SQLite cache file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        # Create the file owner-only; SQLite's journal files inherit its mode
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(path, 0o600)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, "
+            "body TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "expires_at REAL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS gp_history ("
+            "norad_cat_id INTEGER NOT NULL, "
+            "epoch TEXT NOT NULL, "
+            "body TEXT NOT NULL, "
+            "creation_date TEXT, "
+            "PRIMARY KEY (norad_cat_id, epoch))"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(gp_history)")}
+        if 'creation_date' not in columns:
+            # Caches written before rows were selected by CREATION_DATE
+            self._conn.execute("ALTER TABLE gp_history ADD COLUMN creation_date TEXT")
+            self._conn.execute(
+                "UPDATE gp_history "
+                "SET creation_date = json_extract(CAST(body AS TEXT), '$.CREATION_DATE')"
+            )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS gp_history_coverage ("
+            "norad_cat_id INTEGER PRIMARY KEY, "
+            "start_date TEXT NOT NULL, "
+            "end_date TEXT NOT NULL)"
+        )
+        # GP_HISTORY responses were once also cached by URL, never expiring
+        self._conn.execute("DELETE FROM responses WHERE url LIKE '%/class/gp_history/%'")
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Any]:
+        """Return the cached response for a URL, or None if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        body, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return orjson.loads(body)
+
+    def set(self, url: str, data: Any, ttl: Optional[int]):
+        """Store a response for a URL with the given TTL in seconds (None = forever)."""
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (url, orjson.dumps(data), now, expires_at)
+            )
+            self._conn.commit()
+
+    def delete_expired(self) -> int:
+        """Remove expired entries. Returns the number of rows deleted."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    # ==================== GP_HISTORY rows ====================
+
+    def _id_batches(self, norad_ids: Iterable[int]) -> Iterable[List[int]]:
+        """Split NORAD IDs into batches that fit in one IN (...) clause."""
+        ids = list(norad_ids)
+        for i in range(0, len(ids), self.MAX_SQL_PARAMS):
+            yield ids[i:i + self.MAX_SQL_PARAMS]
+
+    def get_history_covered_ids(self, norad_ids: List[int], start_date: str,
+                                end_date: str) -> Set[int]:
+        """Return the NORAD IDs whose downloaded range covers [start_date, end_date]."""
+        covered = set()
+        with self._lock:
+            for batch in self._id_batches(norad_ids):
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT norad_cat_id FROM gp_history_coverage "
+                    f"WHERE norad_cat_id IN ({placeholders}) "
+                    f"AND start_date <= ? AND end_date >= ?",
+                    (*batch, start_date, end_date)
+                ).fetchall()
+                covered.update(row[0] for row in rows)
+        return covered
+
+    def get_history(self, norad_ids: List[int], start_date: str,
+                    end_date: str) -> List[Dict]:
+        """
+        Return stored GP_HISTORY records for the IDs created in the range.
+
+        The range is [start_date, end_date) on CREATION_DATE, the same
+        window SpaceTrackService applies to freshly downloaded records.
+        """
+        results = []
+        with self._lock:
+            for batch in self._id_batches(norad_ids):
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT body FROM gp_history "
+                    f"WHERE norad_cat_id IN ({placeholders}) "
+                    f"AND creation_date >= ? AND creation_date < ? "
+                    f"ORDER BY creation_date, epoch",
+                    (*batch, start_date, end_date)
+                ).fetchall()
+                results.extend(orjson.loads(row[0]) for row in rows)
+        return results
+
+    def store_history(self, records: List[Dict], norad_ids: List[int],
+                      start_date: str, end_date: Optional[str]):
+        """
+        Store GP_HISTORY records and mark the IDs as downloaded for the range.
+
+        An existing coverage range is extended when the new range overlaps
+        or touches it, and replaced otherwise. With end_date None the
+        records are stored without marking any coverage.
+        """
+        rows = [
+            (int(r['NORAD_CAT_ID']), r['EPOCH'], orjson.dumps(r), r.get('CREATION_DATE'))
+            for r in records
+            if r.get('NORAD_CAT_ID') and r.get('EPOCH')
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO gp_history (norad_cat_id, epoch, body, creation_date) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+            if end_date is None:
+                self._conn.commit()
+                return
+            self._conn.executemany(
+                "INSERT INTO gp_history_coverage (norad_cat_id, start_date, end_date) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT(norad_cat_id) DO UPDATE SET "
+                "start_date = CASE WHEN excluded.start_date <= end_date "
+                "AND excluded.end_date >= start_date "
+                "THEN MIN(start_date, excluded.start_date) ELSE excluded.start_date END, "
+                "end_date = CASE WHEN excluded.start_date <= end_date "
+                "AND excluded.end_date >= start_date "
+                "THEN MAX(end_date, excluded.end_date) ELSE excluded.end_date END",
+                [(int(norad_id), start_date, end_date) for norad_id in norad_ids]
+            )
+            self._conn.commit()
@@ -14,18 +14,34 @@ USAGE POLICY COMPLIANCE:
 - Avoid scheduling at :00 or :30 (peak times)
 """
 
+import functools
+import hashlib
+import heapq
+import ijson
+import itertools
+import orjson
+import os
 import requests
+import threading
 import time
 import urllib.parse
+import urllib3.exceptions
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from http.cookiejar import LWPCookieJar
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from config import Config
 from services.account_pool import (
     AccountPoolManager, 
     QueryType, 
-    init_account_pool, 
     get_account_pool
 )
+from services.spacetrack_cache import SpaceTrackCache
 
 
 class SpaceTrackError(Exception):
@@ -48,6 +64,43 @@ class NoAvailableAccountError(SpaceTrackError):
     pass
 
 
+@functools.lru_cache(maxsize=1024)
+def _ids_to_csv(ids: Tuple[int, ...]) -> str:
+    """Join a (sorted) tuple of NORAD IDs into the comma list used in query URLs."""
+    return ','.join(map(str, ids))
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket used to pace outgoing requests.
+    
+    Tokens refill continuously at `rate_per_sec` up to `capacity`; callers
+    block in acquire() only for the fraction of time actually needed.
+    """
+    
+    def __init__(self, rate_per_sec: float, capacity: int):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cost: int = 1):
+        """Take `cost` tokens, sleeping until they are available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            
+            if self.tokens < cost:
+                wait = (cost - self.tokens) / self.rate
+                time.sleep(wait)
+                self.last_refill = now + wait
+                self.tokens = 0.0
+            else:
+                self.tokens -= cost
+
+
 class SpaceTrackService:
     """
     Service for interacting with Space-Track.org API.
@@ -67,32 +120,203 @@ class SpaceTrackService:
     QUERY_TIMEOUT = 120
     BULK_QUERY_TIMEOUT = 300
     
+    # Connection pooling (keep-alive sockets reused across chunked queries)
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 32
+    TRANSPORT_RETRIES = 3
+    TRANSPORT_BACKOFF = 1.5
+    
+    # Process-wide request budget shared by every API method. A bucket lets
+    # through its burst plus rate * window in any window, so burst + rate
+    # stays within the official limit
+    REQUESTS_PER_MINUTE = 25          # Official: 30, conservative: 25
+    REQUESTS_PER_HOUR = 280           # Official: 300, conservative: 280
+    MINUTE_BURST = 5                  # 5 + 25 <= 30 per minute
+    HOUR_BURST = 20                   # 20 + 280 <= 300 per hour
+    
+    # Response cache TTLs by query class in seconds (None = never expire).
+    # GP_HISTORY is not cached by URL: its records live in the cache's row
+    # store, with per-satellite coverage (see iter_gp_history)
+    RESPONSE_CACHE_TTLS = {
+        '/class/gp/': 3600,             # 1 query per hour
+        '/class/satcat/': 86400,        # 1 query per day
+        '/class/announcement/': 1800,
+    }
+    
+    # Longest Retry-After (seconds) worth waiting out on the same account;
+    # longer waits switch to another account from the pool, or fail the query
+    MAX_RETRY_AFTER_WAIT = 60
+    
+    # GP_HISTORY chunk concurrency (paced by the shared request budget)
+    HISTORY_MAX_WORKERS = 4
+    HISTORY_CHUNK_SIZE = 20             # Smaller chunks keep history responses manageable
+    
+    # URL budget for NORAD_CAT_ID lists (server limit is ~4000 chars)
+    MAX_URL_LENGTH = 3500
+    URL_OVERHEAD = len(BASE_URL) + 200  # Class path, predicates, orderby, format
+    
+    # Query URL templates for the per-chunk NORAD ID loops (built once, filled per chunk)
+    SATCAT_BY_ID_URL = (
+        f"{BASE_URL}/basicspacedata/query/class/satcat/"
+        "NORAD_CAT_ID/{ids}/"
+        "format/json"
+    )
+    GP_BY_ID_URL = (
+        f"{BASE_URL}/basicspacedata/query/class/gp/"
+        "NORAD_CAT_ID/{ids}/"
+        "format/json"
+    )
+    # Space-Track API can be finicky, so GP_HISTORY tries each format in turn
+    # Valid Space-Track operators: > < -- ~~ ^ $ <> (NOT >= or <=)
+    GP_HISTORY_URLS = (
+        # Format 1: CREATION_DATE with range operator (recommended by Space-Track)
+        (
+            f"{BASE_URL}/basicspacedata/query/class/gp_history/"
+            "NORAD_CAT_ID/{ids}/"
+            "CREATION_DATE/{start}--{end}/"
+            "orderby/CREATION_DATE%20asc/"
+            "format/json"
+        ),
+        # Format 2: Use EPOCH instead of CREATION_DATE (alternative field)
+        (
+            f"{BASE_URL}/basicspacedata/query/class/gp_history/"
+            "NORAD_CAT_ID/{ids}/"
+            "EPOCH/{start}--{end}/"
+            "orderby/EPOCH%20asc/"
+            "format/json"
+        ),
+        # Format 3: Use > and < operators (NOT >= or <=, they're invalid)
+        (
+            f"{BASE_URL}/basicspacedata/query/class/gp_history/"
+            "NORAD_CAT_ID/{ids}/"
+            "CREATION_DATE/%3E{start}/"
+            "CREATION_DATE/%3C{end}/"
+            "orderby/CREATION_DATE%20asc/"
+            "format/json"
+        ),
+    )
+    
     def __init__(self):
         """Initialize the Space-Track service with account pool."""
-        # Initialize account pool with configured accounts
-        self.account_pool = init_account_pool(Config.SPACETRACK_ACCOUNTS)
+        # Shared account pool (initialized with configured accounts on first use)
+        self.account_pool = get_account_pool()
         
         # Session cache per account
         self._sessions: Dict[str, requests.Session] = {}
         self._session_auth_time: Dict[str, datetime] = {}
+        self._session_lock = threading.Lock()
+        
+        # Token buckets shared by all outgoing queries
+        self._minute_bucket = _TokenBucket(self.REQUESTS_PER_MINUTE / 60, self.MINUTE_BURST)
+        self._hour_bucket = _TokenBucket(self.REQUESTS_PER_HOUR / 3600, self.HOUR_BURST)
         
         # Session expiry (re-auth after this time)
         self._session_max_age = timedelta(hours=1)
         
+        # Persistent response cache for policy-limited query classes
+        self.response_cache = SpaceTrackCache(Config.SPACETRACK_CACHE_PATH)
+        
+        # Login cookies persisted per account so restarts skip re-authentication
+        # (owner-only: the jars hold live session credentials)
+        os.makedirs(Config.SPACETRACK_COOKIE_DIR, mode=0o700, exist_ok=True)
+        
         print(f"[SpaceTrack] Initialized with {len(Config.SPACETRACK_ACCOUNTS)} accounts")
     
     def _get_session(self, username: str) -> requests.Session:
         """Get or create a session for an account."""
-        if username not in self._sessions:
-            session = requests.Session()
-            # Add proper user-agent to avoid being blocked
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'application/json, text/plain, */*',
-                'Accept-Language': 'en-US,en;q=0.9',
-            })
-            self._sessions[username] = session
-        return self._sessions[username]
+        with self._session_lock:
+            if username not in self._sessions:
+                session = requests.Session()
+                # Add proper user-agent to avoid being blocked
+                session.headers.update({
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                    'Accept': 'application/json, text/plain, */*',
+                    'Accept-Language': 'en-US,en;q=0.9',
+                    # gzip/deflate, plus br when a Brotli decoder is installed
+                    'Accept-Encoding': ACCEPT_ENCODING,
+                    'Connection': 'keep-alive',
+                })
+                # Reuse pooled TCP/TLS connections and retry failed connects
+                adapter = self._build_adapter()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.cookies = self._load_cookie_jar(username)
+                self._sessions[username] = session
+            return self._sessions[username]
+    
+    def _cookie_path(self, username: str) -> str:
+        """Get the cookie jar file for an account (hashed, no email on disk)."""
+        digest = hashlib.sha1(username.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(Config.SPACETRACK_COOKIE_DIR, f"{digest}.lwp")
+    
+    def _load_cookie_jar(self, username: str) -> LWPCookieJar:
+        """
+        Load an account's persisted login cookies.
+        
+        A jar saved within the session max age is treated as authenticated;
+        a 401/403 on first use clears it and forces a fresh login.
+        """
+        path = self._cookie_path(username)
+        jar = LWPCookieJar(path)
+        
+        try:
+            jar.load(ignore_discard=True)
+        except (OSError, ValueError):
+            # Missing or unreadable jar - authenticate normally
+            return jar
+        
+        saved_at = datetime.utcfromtimestamp(os.path.getmtime(path))
+        if len(jar) and datetime.utcnow() - saved_at < self._session_max_age:
+            self._session_auth_time[username] = saved_at
+            print(f"[SpaceTrack] Reusing saved login for {username[:10]}***")
+        return jar
+    
+    def _clear_cookie_jar(self, username: str):
+        """Forget an account's persisted login cookies."""
+        session = self._sessions.get(username)
+        if session is not None:
+            session.cookies.clear()
+        try:
+            os.remove(self._cookie_path(username))
+        except FileNotFoundError:
+            pass
+    
+    def _build_adapter(self) -> HTTPAdapter:
+        """
+        Create a pooled HTTP adapter that retries failed connects.
+        
+        Only connection errors raised before the request is sent are retried
+        here. Anything that reached the server (gateway errors, read errors)
+        goes back to _execute_query, whose retries draw from the token buckets.
+        """
+        retry = Retry(
+            total=self.TRANSPORT_RETRIES,
+            connect=self.TRANSPORT_RETRIES,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=self.TRANSPORT_BACKOFF,
+            allowed_methods=["GET", "POST"],
+        )
+        return HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry,
+            pool_block=False,
+        )
+    
+    def _throttled_get(self, session: requests.Session, url: str, **kwargs) -> requests.Response:
+        """Issue a GET after drawing from both the minute and hour request budgets."""
+        self._minute_bucket.acquire()
+        self._hour_bucket.acquire()
+        return session.get(url, **kwargs)
+    
+    def _cache_policy(self, url: str) -> Tuple[bool, Optional[int]]:
+        """Return (cacheable, ttl_seconds) for a query URL."""
+        for fragment, ttl in self.RESPONSE_CACHE_TTLS.items():
+            if fragment in url:
+                return True, ttl
+        return False, None
     
     def _is_session_valid(self, username: str) -> bool:
         """Check if a session is still valid."""
@@ -115,10 +339,15 @@ class SpaceTrackService:
             
             if response.status_code == 200 and 'error' not in response.text.lower():
                 self._session_auth_time[username] = datetime.utcnow()
+                try:
+                    session.cookies.save(ignore_discard=True)
+                    os.chmod(session.cookies.filename, 0o600)
+                except OSError as e:
+                    print(f"[SpaceTrack] Could not persist login cookies: {e}")
                 print(f"[SpaceTrack] Auth success: {username[:10]}***")
                 return True
             else:
-                print(f"[SpaceTrack] Auth failed for {username[:10]}***: {response.text[:100]}")
+                print(f"[SpaceTrack] Auth failed for {username[:10]}***: {self._peek(response, 100)}")
                 return False
                 
         except requests.RequestException as e:
@@ -127,12 +356,69 @@ class SpaceTrackService:
     
     def _ensure_authenticated(self, username: str, password: str) -> bool:
         """Ensure we have a valid authenticated session."""
+        # Creating the session loads any saved login first, so cookies still
+        # within the session max age are reused without a login POST
+        self._get_session(username)
         if self._is_session_valid(username):
             return True
         return self._authenticate(username, password)
     
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Return the Retry-After delay in seconds (delta or HTTP-date form), or None."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+    
+    def _parse_json(self, response: requests.Response) -> Any:
+        """Decode a JSON response body with orjson (raises ValueError if not JSON)."""
+        return orjson.loads(response.content) if response.content else []
+    
+    def _peek(self, response: requests.Response, n: int = 200) -> str:
+        """
+        Return the first n bytes of a response body as text for log previews.
+        
+        Avoids decoding (and charset-sniffing) the whole body via
+        response.text on error paths; streamed bodies are only read as far
+        as needed and the connection is released afterwards.
+        """
+        head = next(response.iter_content(chunk_size=n), b'')
+        response.close()
+        return head[:n].decode(response.encoding or 'utf-8', errors='replace')
+    
+    def _stream_json_items(self, response: requests.Response) -> Any:
+        """
+        Decode a JSON array response record-by-record straight off the socket.
+        
+        Avoids buffering the raw body and its decoded text alongside the
+        parsed records for multi-MB bulk responses. A body that is not an
+        array (e.g. a Space-Track {"error": ...} object) is returned as
+        decoded, like _parse_json, so callers' list checks still reject it.
+        """
+        response.raw.decode_content = True
+        try:
+            events = ijson.parse(response.raw, use_float=True)
+            first = next(events, None)
+            if first is None:
+                return None
+            events = itertools.chain([first], events)
+            if first[1] != 'start_array':
+                return next(ijson.items(events, ''), None)
+            return list(ijson.items(events, 'item'))
+        finally:
+            response.close()
+    
     def _execute_query(self, url: str, query_type: QueryType = QueryType.OTHER,
-                      constellation: str = None, timeout: int = None) -> Optional[Any]:
+                      constellation: str = None, timeout: int = None,
+                      stream: bool = False) -> Optional[Any]:
         """
         Execute a query with automatic account rotation and retry.
         
@@ -141,11 +427,21 @@ class SpaceTrackService:
             query_type: Type of query for rate limit tracking
             constellation: Constellation slug for tracking
             timeout: Request timeout
+            stream: Stream-decode JSON array responses (for bulk queries)
         
         Returns:
             Response data (JSON) or None on failure
         """
         timeout = timeout or self.QUERY_TIMEOUT
+        
+        # Serve policy-limited queries from the on-disk cache when possible
+        cacheable, cache_ttl = self._cache_policy(url)
+        if cacheable:
+            cached = self.response_cache.get(url)
+            if cached is not None:
+                print(f"[SpaceTrack] Cache hit: {url[:100]}", flush=True)
+                return cached
+        
         max_retries = min(5, len(Config.SPACETRACK_ACCOUNTS))
         backoff_time = 2  # Initial backoff in seconds
         
@@ -175,7 +471,7 @@ class SpaceTrackService:
                 
                 # Execute query
                 session = self._get_session(username)
-                response = session.get(url, timeout=timeout)
+                response = self._throttled_get(session, url, timeout=timeout, stream=stream)
                 
                 if response.status_code == 200:
                     # Record successful request
@@ -183,24 +479,55 @@ class SpaceTrackService:
                     
                     # Check for HTML response (indicates error page)
                     content_type = response.headers.get('Content-Type', '')
-                    if 'text/html' in content_type and response.text.startswith('<!DOCTYPE'):
+                    if 'text/html' in content_type and response.content[:9] == b'<!DOCTYPE':
                         print(f"[SpaceTrack] Received HTML error page instead of data", flush=True)
-                        print(f"[SpaceTrack] Response preview: {response.text[:200]}", flush=True)
+                        print(f"[SpaceTrack] Response preview: {self._peek(response)}", flush=True)
                         # Might be a server error disguised as 200
                         continue
                     
-                    try:
-                        return response.json()
-                    except ValueError:
-                        # Return raw text for TLE format
-                        return response.text
+                    if stream and 'json' in content_type:
+                        try:
+                            data = self._stream_json_items(response)
+                        except ijson.JSONError as e:
+                            print(f"[SpaceTrack] Streamed JSON parse error: {e}", flush=True)
+                            self.account_pool.mark_error(username, "Malformed JSON response")
+                            continue
+                        except urllib3.exceptions.HTTPError as e:
+                            # Reads go straight to response.raw, so a truncated or reset
+                            # stream or a read timeout surfaces as a urllib3 error
+                            print(f"[SpaceTrack] Streamed response error: {e}", flush=True)
+                            self.account_pool.mark_error(username, "Broken response stream")
+                            continue
+                    else:
+                        try:
+                            data = self._parse_json(response)
+                        except ValueError:
+                            # Return raw text for TLE format
+                            return response.text
+                    
+                    if cacheable and isinstance(data, list) and data:
+                        self.response_cache.set(url, data, cache_ttl)
+                    return data
                 
                 elif response.status_code == 429:
                     # Rate limited
                     print(f"[SpaceTrack] Rate limited (429) on {username[:10]}***", flush=True)
                     self.account_pool.mark_rate_limited(username)
-                    time.sleep(backoff_time)
-                    backoff_time *= 2  # Exponential backoff
+                    # Honor the server's Retry-After; fall back to exponential backoff
+                    retry_after = self._retry_after(response)
+                    response.close()  # Release the pooled connection before waiting
+                    wait_time = backoff_time if retry_after is None else retry_after
+                    backoff_time *= 2
+                    if wait_time > self.MAX_RETRY_AFTER_WAIT:
+                        if self.account_pool.get_available_account_count():
+                            # Account is now in cooldown, so the next attempt rotates to another one
+                            print(f"[SpaceTrack] Retry-After {wait_time:.0f}s, switching account", flush=True)
+                            continue
+                        # Don't block a history worker or scheduler job for the full
+                        # server wait; the caller treats None as a failed query
+                        print(f"[SpaceTrack] Retry-After {wait_time:.0f}s and no other account available, giving up", flush=True)
+                        return None
+                    time.sleep(wait_time)
                     continue
                 
                 elif response.status_code in (401, 403):
@@ -210,11 +537,13 @@ class SpaceTrackService:
                     # Clear session to force re-auth
                     if username in self._session_auth_time:
                         del self._session_auth_time[username]
+                    self._clear_cookie_jar(username)
                     continue
                 
                 elif response.status_code == 500:
                     # Server error - check if it's a rate limit message
                     response_text = response.text.lower()
+                    response.close()
                     if 'rate limit' in response_text or 'violated your query' in response_text:
                         print(f"[SpaceTrack] Rate limit triggered (500) on {username[:10]}***", flush=True)
                         self.account_pool.mark_rate_limited(username)
@@ -226,7 +555,7 @@ class SpaceTrackService:
                         continue
                     else:
                         # Other 500 error
-                        print(f"[SpaceTrack] Server error (500): {response.text[:300]}", flush=True)
+                        print(f"[SpaceTrack] Server error (500): {response_text[:300]}", flush=True)
                         self.account_pool.mark_error(username, "Server error 500")
                         # Try with different account after short wait
                         time.sleep(2)
@@ -234,7 +563,7 @@ class SpaceTrackService:
                 
                 else:
                     # Other error
-                    print(f"[SpaceTrack] Error {response.status_code}: {response.text[:200]}", flush=True)
+                    print(f"[SpaceTrack] Error {response.status_code}: {self._peek(response)}", flush=True)
                     self.account_pool.mark_error(username, f"HTTP {response.status_code}")
                     
             except requests.Timeout:
@@ -366,7 +695,7 @@ class SpaceTrackService:
                 return result
             
             session = self._get_session(username)
-            response = session.get(url, timeout=30)
+            response = self._throttled_get(session, url, timeout=30)
             
             result['status_code'] = response.status_code
             result['content_type'] = response.headers.get('Content-Type', 'unknown')
@@ -374,18 +703,18 @@ class SpaceTrackService:
             if response.status_code == 200:
                 if 'application/json' in result['content_type']:
                     try:
-                        data = response.json()
+                        data = self._parse_json(response)
                         result['success'] = True
                         result['record_count'] = len(data) if isinstance(data, list) else 1
                         result['response_preview'] = str(data)[:200] if data else 'empty'
                     except ValueError as e:
                         result['error'] = f'JSON parse error: {e}'
-                        result['response_preview'] = response.text[:200]
+                        result['response_preview'] = self._peek(response)
                 else:
-                    result['response_preview'] = response.text[:200]
+                    result['response_preview'] = self._peek(response)
                     result['error'] = f'Unexpected content type: {result["content_type"]}'
             else:
-                result['response_preview'] = response.text[:300]
+                result['response_preview'] = self._peek(response, 300)
                 result['error'] = f'HTTP {response.status_code}'
                 
         except Exception as e:
@@ -393,6 +722,38 @@ class SpaceTrackService:
         
         return result
     
+    def _pack_norad_ids(self, norad_ids: List[int], max_ids: int = None) -> List[List[int]]:
+        """
+        Greedily pack NORAD IDs into chunks whose comma-separated list fits in one URL.
+        
+        Args:
+            norad_ids: NORAD catalog IDs to pack
+            max_ids: Optional cap on IDs per chunk (e.g. to bound response size)
+        
+        Returns:
+            List of ID chunks, in input order
+        """
+        chunks = []
+        current = []
+        current_len = self.URL_OVERHEAD
+        
+        for norad_id in norad_ids:
+            added = len(str(norad_id)) + 1  # digits + comma
+            full = current and (
+                current_len + added > self.MAX_URL_LENGTH
+                or (max_ids and len(current) >= max_ids)
+            )
+            if full:
+                chunks.append(current)
+                current = []
+                current_len = self.URL_OVERHEAD
+            current.append(norad_id)
+            current_len += added
+        
+        if current:
+            chunks.append(current)
+        return chunks
+    
     def _format_query_filter(self, query_filter: str) -> str:
         """
         Convert query filter to proper Space-Track URL format.
@@ -566,26 +927,16 @@ class SpaceTrackService:
         if not norad_ids:
             return []
         
+        # Drop duplicate IDs (order-preserving) so they don't cost URL budget
+        norad_ids = list(dict.fromkeys(norad_ids))
+        
         results = []
-        CHUNK_SIZE = 100
         
-        for i in range(0, len(norad_ids), CHUNK_SIZE):
-            chunk = norad_ids[i:i + CHUNK_SIZE]
-            id_list = ",".join(map(str, chunk))
-            
-            url = (
-                f"{self.BASE_URL}/basicspacedata/query/class/satcat/"
-                f"NORAD_CAT_ID/{id_list}/"
-                f"format/json"
-            )
-            
+        for chunk in self._pack_norad_ids(norad_ids):
+            url = self.SATCAT_BY_ID_URL.format(ids=_ids_to_csv(tuple(sorted(chunk))))
             data = self._execute_query(url, QueryType.SATCAT)
             if isinstance(data, list):
                 results.extend(data)
-            
-            # Throttle between chunks
-            if i + CHUNK_SIZE < len(norad_ids):
-                time.sleep(2)
         
         return results
     
@@ -609,8 +960,21 @@ class SpaceTrackService:
         Returns:
             List of historical GP records
         """
+        return list(self.iter_gp_history(norad_ids, start_date, end_date, constellation))
+    
+    def iter_gp_history(self, norad_ids: List[int], start_date: datetime,
+                        end_date: datetime = None, constellation: str = None) -> Iterator[Dict]:
+        """
+        Yield historical GP records chunk by chunk as they are downloaded.
+        
+        Same arguments and caching as get_gp_history, but callers can
+        process (e.g. store) records while later chunks are still in flight
+        instead of holding the whole history in memory.
+        """
         if not norad_ids:
-            return []
+            return
+        
+        norad_ids = list(dict.fromkeys(norad_ids))
         
         if not end_date:
             end_date = datetime.utcnow()
@@ -624,10 +988,10 @@ class SpaceTrackService:
             print(f"[SpaceTrack] WARNING: Date range ({date_span} days) exceeds recommended limit ({max_days} days)", flush=True)
             print(f"[SpaceTrack] Consider downloading year-bundled files for large ranges", flush=True)
             # Split into yearly chunks
-            return self._get_gp_history_chunked_by_year(norad_ids, start_date, end_date, constellation)
+            yield from self._iter_gp_history_by_year(norad_ids, start_date, end_date, constellation)
+            return
         
-        results = []
-        CHUNK_SIZE = 20  # Smaller chunks for history queries
+        total_records = 0
         
         # Use CREATION_DATE instead of EPOCH for GP_HISTORY queries
         # Format: CREATION_DATE/start--end/ or CREATION_DATE/>start/
@@ -638,89 +1002,106 @@ class SpaceTrackService:
         print(f"[SpaceTrack] Date range: {start_str} to {end_str} ({date_span} days)", flush=True)
         print(f"[SpaceTrack] NOTE: GP_HISTORY should be downloaded once and stored locally", flush=True)
         
-        total_chunks = (len(norad_ids) - 1) // CHUNK_SIZE + 1
+        # Records are selected on CREATION_DATE in [start_str, end_str), whether
+        # they come from the local row store or a fresh download
+        def in_range(record: Dict) -> bool:
+            return start_str <= (record.get('CREATION_DATE') or '') < end_str
+        
+        # Days before today are final; records can still be published today
+        coverage_end = min(end_str, datetime.utcnow().strftime('%Y-%m-%d'))
+        if coverage_end <= start_str:
+            coverage_end = None
+        
+        # Satellites already downloaded for this range are served from the local row store
+        covered_ids = self.response_cache.get_history_covered_ids(norad_ids, start_str, end_str)
+        if covered_ids:
+            print(f"[SpaceTrack] {len(covered_ids)} satellites already downloaded for this range", flush=True)
+            cached = self.response_cache.get_history(list(covered_ids), start_str, end_str)
+            total_records += len(cached)
+            yield from cached
+        
+        missing_ids = [norad_id for norad_id in norad_ids if norad_id not in covered_ids]
+        chunks = self._pack_norad_ids(missing_ids, max_ids=self.HISTORY_CHUNK_SIZE)
+        total_chunks = len(chunks)
+        
+        def fetch(args):
+            chunk_num, chunk = args
+            return self._fetch_history_chunk(
+                chunk, chunk_num, total_chunks, start_str, end_str, constellation
+            )
         
-        for i in range(0, len(norad_ids), CHUNK_SIZE):
-            chunk = norad_ids[i:i + CHUNK_SIZE]
-            chunk_num = i // CHUNK_SIZE + 1
-            id_list = ",".join(map(str, chunk))
-            
-            # Try different URL formats - Space-Track API can be finicky
-            # Valid Space-Track operators: > < -- ~~ ^ $ <> (NOT >= or <=)
-            urls_to_try = [
-                # Format 1: CREATION_DATE with range operator (recommended by Space-Track)
-                (
-                    f"{self.BASE_URL}/basicspacedata/query/class/gp_history/"
-                    f"NORAD_CAT_ID/{id_list}/"
-                    f"CREATION_DATE/{start_str}--{end_str}/"
-                    f"orderby/CREATION_DATE%20asc/"
-                    f"format/json"
-                ),
-                # Format 2: Use EPOCH instead of CREATION_DATE (alternative field)
-                (
-                    f"{self.BASE_URL}/basicspacedata/query/class/gp_history/"
-                    f"NORAD_CAT_ID/{id_list}/"
-                    f"EPOCH/{start_str}--{end_str}/"
-                    f"orderby/EPOCH%20asc/"
-                    f"format/json"
-                ),
-                # Format 3: Use > and < operators (NOT >= or <=, they're invalid)
-                (
-                    f"{self.BASE_URL}/basicspacedata/query/class/gp_history/"
-                    f"NORAD_CAT_ID/{id_list}/"
-                    f"CREATION_DATE/%3E{start_str}/"
-                    f"CREATION_DATE/%3C{end_str}/"
-                    f"orderby/CREATION_DATE%20asc/"
-                    f"format/json"
-                ),
-            ]
-            
-            data = None
-            for url_idx, url in enumerate(urls_to_try, 1):
-                print(f"[SpaceTrack] Querying history chunk {chunk_num}/{total_chunks} (format {url_idx}/{len(urls_to_try)})...", flush=True)
-                print(f"[SpaceTrack] URL: {url[:150]}...", flush=True)
-                
-                data = self._execute_query(
-                    url, 
-                    QueryType.GP_HISTORY, 
-                    constellation,
-                    timeout=self.BULK_QUERY_TIMEOUT
-                )
-                
-                if isinstance(data, list):
-                    if data:
-                        print(f"[SpaceTrack] Chunk {chunk_num}: {len(data)} records (format {url_idx} succeeded)", flush=True)
-                        break
-                    else:
-                        print(f"[SpaceTrack] Chunk {chunk_num}: Format {url_idx} returned empty list", flush=True)
-                elif data is None:
-                    print(f"[SpaceTrack] Chunk {chunk_num}: Format {url_idx} failed, trying next...", flush=True)
-                    if url_idx < len(urls_to_try):
-                        time.sleep(3)  # Wait before trying next format
-                    continue
+        # Overlap server response times across a bounded number of in-flight chunks;
+        # pacing comes from the shared token buckets in _throttled_get.
+        if chunks:
+            workers = min(self.HISTORY_MAX_WORKERS, total_chunks)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for chunk, (data, by_creation_date) in zip(chunks, executor.map(fetch, enumerate(chunks, 1))):
+                    if isinstance(data, list):
+                        if by_creation_date:
+                            self.response_cache.store_history(data, chunk, start_str, coverage_end)
+                            data = [record for record in data if in_range(record)]
+                        else:
+                            # EPOCH-filtered fallback: keep the rows, but they don't
+                            # prove the CREATION_DATE range was downloaded
+                            self.response_cache.store_history(data, chunk, start_str, None)
+                        total_records += len(data)
+                        yield from data
+        
+        print(f"[SpaceTrack] GP history complete: {total_records} total records", flush=True)
+    
+    def _fetch_history_chunk(self, chunk: List[int], chunk_num: int, total_chunks: int,
+                             start_str: str, end_str: str,
+                             constellation: str = None) -> Tuple[Optional[List[Dict]], bool]:
+        """
+        Fetch GP history for one chunk of NORAD IDs.
+        
+        Tries each known URL format in turn and returns the first non-empty
+        list response (else the last list, or None if every format failed),
+        plus whether the URL that returned it selected by CREATION_DATE.
+        """
+        id_list = _ids_to_csv(tuple(sorted(chunk)))
+        
+        urls_to_try = [
+            template.format(ids=id_list, start=start_str, end=end_str)
+            for template in self.GP_HISTORY_URLS
+        ]
+        
+        data, by_creation_date = None, False
+        for url_idx, url in enumerate(urls_to_try, 1):
+            print(f"[SpaceTrack] Querying history chunk {chunk_num}/{total_chunks} (format {url_idx}/{len(urls_to_try)})...", flush=True)
+            print(f"[SpaceTrack] URL: {url[:150]}...", flush=True)
             
-            if isinstance(data, list):
-                results.extend(data)
-            elif data is None:
-                print(f"[SpaceTrack] Chunk {chunk_num}: All formats failed, skipping this chunk", flush=True)
+            result = self._execute_query(
+                url, 
+                QueryType.GP_HISTORY, 
+                constellation,
+                timeout=self.BULK_QUERY_TIMEOUT,
+                stream=True
+            )
             
-            # Throttle between chunks - GP_HISTORY has strict rate limits
-            if i + CHUNK_SIZE < len(norad_ids):
-                wait_time = 10  # Longer wait for history queries
-                print(f"[SpaceTrack] Waiting {wait_time}s before next chunk...", flush=True)
-                time.sleep(wait_time)
+            if isinstance(result, list):
+                # Only a list the server returned for a CREATION_DATE URL
+                # shows that range was downloaded
+                data, by_creation_date = result, '/CREATION_DATE/' in url
+                if result:
+                    print(f"[SpaceTrack] Chunk {chunk_num}: {len(result)} records (format {url_idx} succeeded)", flush=True)
+                    break
+                else:
+                    print(f"[SpaceTrack] Chunk {chunk_num}: Format {url_idx} returned empty list", flush=True)
+            else:
+                print(f"[SpaceTrack] Chunk {chunk_num}: Format {url_idx} failed, trying next...", flush=True)
         
-        print(f"[SpaceTrack] GP history complete: {len(results)} total records", flush=True)
-        return results
+        if data is None:
+            print(f"[SpaceTrack] Chunk {chunk_num}: All formats failed, skipping this chunk", flush=True)
+        return data, by_creation_date
     
-    def _get_gp_history_chunked_by_year(self, norad_ids: List[int], start_date: datetime,
-                                        end_date: datetime, constellation: str = None) -> List[Dict]:
+    def _iter_gp_history_by_year(self, norad_ids: List[int], start_date: datetime,
+                                 end_date: datetime, constellation: str = None) -> Iterator[Dict]:
         """
-        Fetch GP history by splitting into yearly chunks.
+        Yield GP history by splitting into yearly chunks.
         
         This is used when the date range exceeds recommended limits.
         """
-        results = []
         current_start = start_date
         
         while current_start < end_date:
@@ -732,23 +1113,15 @@ class SpaceTrackService:
             
             print(f"[SpaceTrack] Fetching year {current_start.year}...", flush=True)
             
-            year_results = self.get_gp_history(
+            yield from self.iter_gp_history(
                 norad_ids, 
                 current_start, 
                 current_end, 
                 constellation
             )
             
-            results.extend(year_results)
-            
             # Move to next year
             current_start = current_end
-            
-            # Wait between years
-            if current_start < end_date:
-                time.sleep(5)
-        
-        return results
     
     def get_latest_tle_by_norad(self, norad_ids: List[int]) -> List[Dict]:
         """
@@ -763,15 +1136,17 @@ class SpaceTrackService:
         if not norad_ids:
             return []
         
-        norad_str = ','.join(map(str, norad_ids))
-        url = (
-            f"{self.BASE_URL}/basicspacedata/query/class/gp/"
-            f"NORAD_CAT_ID/{norad_str}/"
-            f"format/json"
-        )
+        norad_ids = list(dict.fromkeys(norad_ids))
         
-        data = self._execute_query(url, QueryType.GP)
-        return data if isinstance(data, list) else []
+        results = []
+        
+        for chunk in self._pack_norad_ids(norad_ids):
+            url = self.GP_BY_ID_URL.format(ids=_ids_to_csv(tuple(sorted(chunk))))
+            data = self._execute_query(url, QueryType.GP)
+            if isinstance(data, list):
+                results.extend(data)
+        
+        return results
     
     def get_gp_by_name_pattern(self, pattern: str, constellation: str = None, 
                                 limit: int = None) -> List[Dict]:
@@ -840,10 +1215,6 @@ class SpaceTrackService:
                 norad_id = record.get('NORAD_CAT_ID')
                 if norad_id and norad_id not in all_results:
                     all_results[norad_id] = record
-            
-            # Throttle between pattern queries
-            if len(patterns) > 1:
-                time.sleep(2)
         
         result_list = list(all_results.values())
         print(f"[SpaceTrack] Combined results: {len(result_list)} unique satellites", flush=True)
@@ -921,17 +1292,55 @@ class SpaceTrackService:
         data = self._execute_query(url, QueryType.SATCAT)
         return data if isinstance(data, list) else []
     
+    def get_tle_publish_stats(self, days: int = 21) -> List[Dict]:
+        """
+        Get TLE publication statistics (number of GP element sets per epoch date).
+        
+        Args:
+            days: Number of days to look back
+        
+        Returns:
+            List of {'date': 'YYYY-MM-DD', 'count': int} for at most the
+            `days` most recent dates, sorted by date
+        """
+        # Only the EPOCH field is needed, which keeps the 10k-record payload small
+        url = (
+            f"{self.BASE_URL}/basicspacedata/query/class/gp/"
+            f"EPOCH/>now-{days}/"
+            f"predicates/EPOCH/"
+            f"orderby/EPOCH%20desc/"
+            f"limit/10000/"
+            f"format/json"
+        )
+        
+        data = self._execute_query(url, QueryType.GP, stream=True)
+        if not isinstance(data, list):
+            return []
+        
+        date_counts = Counter(
+            entry['EPOCH'][:10] for entry in data if entry.get('EPOCH')
+        )
+        # Keep only the most recent `days` dates; the final sort is over k items
+        recent = heapq.nlargest(days, date_counts.items(), key=lambda kv: kv[0])
+        return [{'date': d, 'count': c} for d, c in sorted(recent)]
+    
     def get_full_status(self) -> Dict[str, Any]:
         """Get comprehensive Space-Track status including all metrics."""
         status = self.get_api_status()
         
         if status['status'] == 'online':
-            try:
-                status['tip_messages'] = self.get_tip_messages(10)
-                status['announcements'] = self.get_announcements()
-                status['recent_decays'] = self.get_decay_data(7)[:10]
-            except Exception as e:
-                status['additional_data_error'] = str(e)
+            # Independent queries - issue them together so wall time is max, not sum, of RTTs
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                tip_future = executor.submit(self.get_tip_messages, 10)
+                announcements_future = executor.submit(self.get_announcements)
+                decays_future = executor.submit(self.get_decay_data, 7)
+                
+                try:
+                    status['tip_messages'] = tip_future.result()
+                    status['announcements'] = announcements_future.result()
+                    status['recent_decays'] = decays_future.result()[:10]
+                except Exception as e:
+                    status['additional_data_error'] = str(e)
         
         return status
     
@@ -940,14 +1349,38 @@ class SpaceTrackService:
         for username, session in self._sessions.items():
             try:
                 session.get(self.LOGOUT_URL, timeout=10)
-            except:
+            except requests.RequestException:
                 pass
             finally:
+                # Server-side session is gone; don't reuse its cookies on restart
+                self._session_auth_time.pop(username, None)
+                self._clear_cookie_jar(username)
                 session.close()
         
         self._sessions.clear()
         self._session_auth_time.clear()
 
 
-# Singleton instance
-spacetrack_service = SpaceTrackService()
+_spacetrack_service: Optional[SpaceTrackService] = None
+_spacetrack_service_lock = threading.Lock()
+
+
+def get_spacetrack_service() -> SpaceTrackService:
+    """Get the SpaceTrackService singleton, creating it on first use."""
+    global _spacetrack_service
+    if _spacetrack_service is None:
+        with _spacetrack_service_lock:
+            if _spacetrack_service is None:
+                _spacetrack_service = SpaceTrackService()
+    return _spacetrack_service
+
+
+class _LazySpaceTrackService:
+    """Module-level stand-in that builds the real service on first attribute access."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_spacetrack_service(), name)
+
+
+# Singleton instance (created lazily so importing this module stays cheap)
+spacetrack_service = _LazySpaceTrackService()
@@ -1,43 +1,190 @@
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime, timedelta
+import functools
+import itertools
 import math
-from sqlalchemy import func
+import re
+import threading
+import time
+import numpy as np
+from flask import g, has_request_context
+from sqlalchemy import case, func, or_
 
 from models import db, Satellite, Constellation, TLEHistory, Launch
 
+# Strips everything but digits from the launch-number part of a designator
+_NON_DIGIT_RE = re.compile(r'\D')
+
+
+class _IsoDates(dict):
+    """
+    date -> isoformat() string, formatted once per distinct date.
+    
+    Satellites launched together or decayed on the same day share dates,
+    so per-row formatting mostly repeats the same work.
+    """
+    def __missing__(self, key):
+        value = self[key] = key.isoformat()
+        return value
+
+
+def _cumulative_counts(launches: np.ndarray, decays: np.ndarray,
+                       launch_counts: np.ndarray = None, decay_counts: np.ndarray = None):
+    """
+    Running launch/decay totals per distinct event date.
+    
+    Args:
+        launches: datetime64 array of launch dates
+        decays: datetime64 array of decay dates
+        launch_counts: Optional number of launches on each entry of launches
+        decay_counts: Optional number of decays on each entry of decays
+    
+    Returns:
+        (sorted unique dates, cumulative launches, cumulative decays)
+    """
+    # One sort for both event kinds; the inverse maps each event to its date slot
+    dates, slots = np.unique(np.concatenate([launches, decays]), return_inverse=True)
+    slots = slots.ravel()
+    launched = np.cumsum(np.bincount(
+        slots[:len(launches)], weights=launch_counts, minlength=len(dates)
+    ).astype(np.int64))
+    decayed = np.cumsum(np.bincount(
+        slots[len(launches):], weights=decay_counts, minlength=len(dates)
+    ).astype(np.int64))
+    return dates, launched, decayed
+
+
+def _ttl_cached(method):
+    """
+    Cache a StatisticsService method's result per call arguments.
+    
+    Entries live for CACHE_TTL seconds or until invalidate_cache(); cached
+    results are shared between callers and must not be mutated.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        
+        result = method(self, *args, **kwargs)
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= self.CACHE_MAXSIZE:
+                self._cache.pop(next(iter(self._cache)))  # Evict the oldest entry
+            self._cache[key] = (now + self.CACHE_TTL, result)
+        return result
+    return wrapper
+
+
 class StatisticsService:
     EARTH_RADIUS_KM = 6378.137
+    
+    # Constellation statistics only change when TLE/SATCAT data is ingested
+    CACHE_TTL = 300  # seconds
+    CACHE_MAXSIZE = 512
 
+    def __init__(self):
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
+        # constellation_id -> (max TLEHistory id when built, first epoch map)
+        self._first_epoch_maps: Dict[int, tuple] = {}
+        # slug -> constellation id; constellations are few and never renumbered
+        self._constellation_ids: Dict[str, int] = {}
+
+    def invalidate_cache(self, slug: str = None):
+        """Drop cached statistics for one constellation, or all of them."""
+        if has_request_context():
+            g.pop('first_epoch_maps', None)
+        with self._cache_lock:
+            self._first_epoch_maps.clear()  # Cheap to rebuild; satellites may have moved
+            if slug is None:
+                self._cache.clear()
+                self._constellation_ids.clear()
+            else:
+                self._constellation_ids.pop(slug, None)
+                for key in [k for k in self._cache if k[1][:1] == (slug,)]:
+                    del self._cache[key]
+
+    @_ttl_cached
     def get_constellation_summary(self, slug: str) -> Dict[str, Any]:
         """Basic summary stats for a constellation."""
-        constellation = Constellation.query.filter_by(slug=slug).first()
-        if not constellation:
+        # Constellation columns and both counts in a single round trip
+        row = db.session.query(
+                Constellation.name,
+                Constellation.updated_at,
+                func.count(Satellite.id),
+                func.sum(case((Satellite.is_active, 1), else_=0))
+            )\
+            .outerjoin(Satellite, Satellite.constellation_id == Constellation.id)\
+            .filter(Constellation.slug == slug)\
+            .group_by(Constellation.id)\
+            .first()
+        if not row:
             return None
             
-        total = Satellite.query.filter_by(constellation_id=constellation.id).count()
-        active = Satellite.query.filter_by(constellation_id=constellation.id, is_active=True).count()
+        name, updated_at, total, active = row
         
         return {
-            'name': constellation.name,
+            'name': name,
             'total_count': total,
-            'active_count': active,
-            'updated_at': constellation.updated_at.isoformat() if constellation.updated_at else None
+            'active_count': active or 0,
+            'updated_at': updated_at.isoformat() if updated_at else None
         }
 
+    def _get_constellation_id(self, slug: str) -> Optional[int]:
+        """Return the id of the constellation with this slug, or None if unknown."""
+        constellation_id = self._constellation_ids.get(slug)
+        if constellation_id is None:
+            constellation_id = db.session.query(Constellation.id)\
+                .filter_by(slug=slug)\
+                .scalar()
+            if constellation_id is None:
+                return None  # Not cached, so a later-created constellation is found
+            self._constellation_ids[slug] = constellation_id
+        return constellation_id
+
     def _get_first_epoch_map(self, constellation_id: int) -> Dict[int, datetime]:
-        """Return earliest TLE epoch per satellite for a constellation."""
+        """
+        Return earliest TLE epoch per satellite for a constellation.
+        
+        The GROUP BY over TLEHistory is memoized until new history rows are
+        added, detected via the table's max id (a primary-key lookup). Within
+        a request the map is also kept on flask.g, so later callers in the
+        same request skip even that lookup.
+        """
+        request_maps = None
+        if has_request_context():
+            request_maps = g.setdefault('first_epoch_maps', {})
+            if constellation_id in request_maps:
+                return request_maps[constellation_id]
+        
+        latest_id = db.session.query(func.max(TLEHistory.id)).scalar()
+        cached = self._first_epoch_maps.get(constellation_id)
+        if cached and cached[0] == latest_id:
+            first_epoch_map = cached[1]
+            if request_maps is not None:
+                request_maps[constellation_id] = first_epoch_map
+            return first_epoch_map
+        
         rows = db.session.query(
             TLEHistory.satellite_id,
             func.min(TLEHistory.epoch)
         ).join(Satellite, Satellite.id == TLEHistory.satellite_id)\
          .filter(Satellite.constellation_id == constellation_id)\
          .group_by(TLEHistory.satellite_id).all()
-        return {sat_id: epoch for sat_id, epoch in rows if epoch}
+        first_epoch_map = {sat_id: epoch for sat_id, epoch in rows if epoch}
+        self._first_epoch_maps[constellation_id] = (latest_id, first_epoch_map)
+        if request_maps is not None:
+            request_maps[constellation_id] = first_epoch_map
+        return first_epoch_map
 
     def _estimate_launch_date(self, satellite: Satellite, first_epoch_map: Dict[int, datetime]) -> datetime:
         """Best-effort launch date estimation when SATCAT data is missing."""
         if satellite.launch_date:
-            return datetime.combine(satellite.launch_date, datetime.min.time())
+            return datetime.fromordinal(satellite.launch_date.toordinal())
         
         # Parse international designator (format: YYNNN or YYYYNNN)
         # e.g., "19074B" -> 2019, launch 074
@@ -54,7 +201,7 @@ class StatisticsService:
                         year += 2000
                     
                     # Try to extract launch number for rough month estimation
-                    launch_num_str = ''.join(c for c in intl[2:5] if c.isdigit())
+                    launch_num_str = _NON_DIGIT_RE.sub('', intl[2:5])
                     if launch_num_str:
                         launch_num = int(launch_num_str)
                         # Estimate month based on launch number (rough: assume ~30 launches/month globally)
@@ -72,153 +219,229 @@ class StatisticsService:
         
         return None
 
+    def _estimate_launch_dates(self, satellites: List[Satellite],
+                               first_epoch_map: Dict[int, datetime]) -> Dict[int, datetime]:
+        """
+        Batch version of _estimate_launch_date, keyed by satellite id.
+        Accepts Satellite objects or column rows with the same attribute names.
+        
+        International designators are parsed together as a fixed-width
+        character array; unusual designators (non-digit year, non-ASCII)
+        go through _estimate_launch_date so results are identical.
+        """
+        estimates = {}
+        to_parse = []
+        # Midnight datetime from the day ordinal: cheaper than datetime.combine()
+        from_ordinal = datetime.fromordinal
+        for s in satellites:
+            if s.launch_date:
+                estimates[s.id] = from_ordinal(s.launch_date.toordinal())
+            elif s.intl_designator and len(s.intl_designator.strip()) >= 5:
+                to_parse.append(s)
+            else:
+                estimates[s.id] = first_epoch_map.get(s.id) or s.tle_epoch
+        
+        if not to_parse:
+            return estimates
+        
+        # First 5 characters of each designator as code points: (n, 5)
+        codes = np.array(
+            [s.intl_designator.strip()[:5] for s in to_parse], dtype='U5'
+        ).view(np.uint32).reshape(-1, 5).astype(np.int64)
+        is_digit = (codes >= 48) & (codes <= 57)
+        digits = np.where(is_digit, codes - 48, 0)
+        parsed = is_digit[:, 0] & is_digit[:, 1] & (codes < 128).all(axis=1)
+        
+        # Convert 2-digit year to 4-digit (Sputnik launched 1957)
+        year = digits[:, 0] * 10 + digits[:, 1]
+        year += np.where(year >= 57, 1900, 2000)
+        
+        # Launch number from the digits in [2:5]; rough month at ~8 launches per month
+        launch_num = np.zeros(len(to_parse), dtype=np.int64)
+        for col in range(2, 5):
+            launch_num = np.where(is_digit[:, col], launch_num * 10 + digits[:, col], launch_num)
+        has_num = is_digit[:, 2:5].any(axis=1)
+        month = np.where(has_num, np.clip(launch_num // 8 + 1, 1, 12), 1)
+        day = np.where(has_num, 15, 1)
+        
+        dates = (
+            ((year - 1970) * 12 + month - 1).astype('datetime64[M]').astype('datetime64[D]')
+            + (day - 1).astype('timedelta64[D]')
+        ).astype('datetime64[s]').tolist()
+        
+        for s, ok, date in zip(to_parse, parsed.tolist(), dates):
+            estimates[s.id] = date if ok else self._estimate_launch_date(s, first_epoch_map)
+        return estimates
+
+    @staticmethod
+    def _round_or_zero(values, keep: np.ndarray, decimals: int) -> List:
+        """Round the selected values, mapping missing/zero values to 0."""
+        # round() rather than np.round: NumPy rounds the scaled value, which
+        # differs from round() on decimal ties (e.g. 540.125)
+        arr = np.array(values, dtype=np.float64)[keep]
+        present = (~np.isnan(arr) & (arr != 0)).tolist()
+        return [round(v, decimals) if ok else 0 for v, ok in zip(arr.tolist(), present)]
+
     def get_orbital_decay(self, norad_id: int) -> List[Dict]:
         """
         Get altitude history for a satellite (Orbital Decay).
         """
+        return list(self.iter_orbital_decay(norad_id))
+
+    def iter_orbital_decay(self, norad_id: int) -> Iterator[Dict]:
+        """
+        Yield altitude history points for a satellite (Orbital Decay).
+
+        Same records as get_orbital_decay(), produced batch by batch so
+        long histories can be streamed without building the full list.
+        """
         sat = Satellite.query.filter_by(norad_id=norad_id).first()
         if not sat:
-            return []
+            return
+            
+        # Query TLEHistory for this satellite - plain column tuples, streamed
+        # in batches, so long histories don't build an ORM object per row
+        history = db.session.query(
+                TLEHistory.epoch,
+                TLEHistory.semi_major_axis_km,
+                TLEHistory.perigee_km,
+                TLEHistory.apogee_km,
+                TLEHistory.inclination
+            )\
+            .filter(TLEHistory.satellite_id == sat.id)\
+            .order_by(TLEHistory.epoch.asc())\
+            .yield_per(2000)
             
-        # Query TLEHistory for this satellite
-        history = TLEHistory.query.filter_by(satellite_id=sat.id)\
-            .order_by(TLEHistory.epoch.asc()).all()
+        found = False
+        rows = iter(history)
+        while True:
+            batch = list(itertools.islice(rows, 2000))
+            if not batch:
+                break
+            epochs, sma, perigee, apogee, inclination = zip(*batch)
             
-        data = []
-        for h in history:
             # Calculate mean altitude
-            # Altitude = Semi-major axis - Earth Radius
-            alt = h.semi_major_axis_km - self.EARTH_RADIUS_KM if h.semi_major_axis_km else 0
+            # Altitude = Semi-major axis - Earth Radius (missing values become NaN)
+            alt = np.array(sma, dtype=np.float64) - self.EARTH_RADIUS_KM
             
             # Filter valid altitudes (LEO usually > 150km, GEO ~36000km)
-            if alt > 100:
-                data.append({
-                    'date': h.epoch.isoformat(),
-                    'altitude_km': round(alt, 2),
-                    'perigee_km': round(h.perigee_km, 2) if h.perigee_km else 0,
-                    'apogee_km': round(h.apogee_km, 2) if h.apogee_km else 0,
-                    'inclination_deg': round(h.inclination, 4) if h.inclination else 0
-                })
+            keep = np.flatnonzero(alt > 100)
+            if not keep.size:
+                continue
+            
+            kept = keep.tolist()
+            found = True
+            yield from ({
+                'date': epochs[i].isoformat(),
+                'altitude_km': a,
+                'perigee_km': p,
+                'apogee_km': ap,
+                'inclination_deg': inc
+            } for i, a, p, ap, inc in zip(
+                kept,
+                [round(a, 2) for a in alt[keep].tolist()],
+                self._round_or_zero(perigee, keep, 2),
+                self._round_or_zero(apogee, keep, 2),
+                self._round_or_zero(inclination, keep, 4)
+            ))
         
         # If no history, add current state if available
-        if not data and sat.semi_major_axis_km:
+        if not found and sat.semi_major_axis_km:
              alt = sat.semi_major_axis_km - self.EARTH_RADIUS_KM
              if alt > 100:
-                 data.append({
+                 yield {
                     'date': sat.tle_epoch.isoformat() if sat.tle_epoch else datetime.utcnow().isoformat(),
                     'altitude_km': round(alt, 2),
                     'perigee_km': round(sat.perigee_km, 2) if sat.perigee_km else 0,
                     'apogee_km': round(sat.apogee_km, 2) if sat.apogee_km else 0,
                     'inclination_deg': round(sat.inclination, 4) if sat.inclination else 0
-                 })
-                 
-        return data
+                 }
 
+    @_ttl_cached
     def get_altitude_distribution(self, slug: str) -> List[Dict]:
         """
         Get distribution of satellite altitudes for a constellation.
         Returns histogram data.
         """
-        constellation = Constellation.query.filter_by(slug=slug).first()
-        if not constellation:
+        cid = self._get_constellation_id(slug)
+        if cid is None:
             return []
             
-        # Get latest TLE for all satellites
-        sats = Satellite.query.filter_by(constellation_id=constellation.id).all()
-        altitudes = []
-        
-        for s in sats:
-            if s.semi_major_axis_km:
-                alt = s.semi_major_axis_km - self.EARTH_RADIUS_KM
-                if 100 < alt < 100000:  # Filter meaningful ranges
-                    altitudes.append(alt)
+        # Get latest TLE for all satellites (only the column we need)
+        rows = db.session.query(Satellite.semi_major_axis_km)\
+            .filter(Satellite.constellation_id == cid)\
+            .all()
+        altitudes = np.fromiter(
+            (sma for (sma,) in rows if sma),
+            dtype=np.float64
+        ) - self.EARTH_RADIUS_KM
+        altitudes = altitudes[(altitudes > 100) & (altitudes < 100000)]  # Filter meaningful ranges
         
-        if not altitudes:
+        if not altitudes.size:
             return []
             
-        # Calculate histogram manually
-        min_alt = min(altitudes)
-        max_alt = max(altitudes)
+        min_alt = float(altitudes.min())
+        max_alt = float(altitudes.max())
         
         # Determine appropriate bin size (e.g., 20 bins)
         num_bins = 20
         if max_alt == min_alt:
-            bin_width = 10
-            max_alt += 10
-        else:
-            bin_width = (max_alt - min_alt) / num_bins
+            max_alt = min_alt + num_bins * 10  # Single altitude: 10 km bins
             
-        bins = [0] * num_bins
-        bin_edges = [min_alt + i * bin_width for i in range(num_bins + 1)]
+        counts, bin_edges = np.histogram(altitudes, bins=num_bins, range=(min_alt, max_alt))
         
-        for alt in altitudes:
-            index = int((alt - min_alt) / bin_width)
-            if index >= num_bins:
-                index = num_bins - 1
-            bins[index] += 1
-            
-        result = []
-        for i in range(num_bins):
-            if bins[i] > 0:  # Only return populated bins to save space
-                result.append({
-                    'bin_start_km': round(bin_edges[i], 1),
-                    'bin_end_km': round(bin_edges[i+1], 1),
-                    'count': bins[i]
-                })
-            
-        return result
+        # Only return populated bins to save space
+        return [{
+            'bin_start_km': round(float(bin_edges[i]), 1),
+            'bin_end_km': round(float(bin_edges[i + 1]), 1),
+            'count': int(counts[i])
+        } for i in np.flatnonzero(counts)]
 
+    @_ttl_cached
     def get_inclination_distribution(self, slug: str) -> List[Dict]:
         """Get inclination distribution."""
-        constellation = Constellation.query.filter_by(slug=slug).first()
-        if not constellation:
+        cid = self._get_constellation_id(slug)
+        if cid is None:
             return []
             
-        sats = Satellite.query.filter_by(constellation_id=constellation.id).all()
-        inclinations = [s.inclination for s in sats if s.inclination is not None]
-        
-        if not inclinations:
+        rows = db.session.query(Satellite.inclination)\
+            .filter(Satellite.constellation_id == cid,
+                    Satellite.inclination.isnot(None))\
+            .all()
+        if not rows:
             return []
             
-        # Group by integer degree (simple histogram)
-        dist = {}
-        for inc in inclinations:
-            key = round(inc, 1)  # Round to 1 decimal place
-            dist[key] = dist.get(key, 0) + 1
-            
-        # Convert to list sorted by inclination
-        result = [{'inclination': k, 'count': v} for k, v in sorted(dist.items())]
-        return result
+        # Group by 0.1 degree (simple histogram); bincount output is already sorted.
+        # Bin keys come from round() rather than np.rint(inc * 10): NumPy rounds
+        # the scaled value, which differs from round() on decimal ties (e.g. 53.15)
+        keys = np.array([round(inc, 1) for (inc,) in rows], dtype=np.float64)
+        bins = np.rint(keys * 10).astype(np.int64)
+        offset = int(bins.min())
+        counts = np.bincount(bins - offset)
+        return [{'inclination': (i + offset) / 10, 'count': int(counts[i])}
+                for i in np.flatnonzero(counts).tolist()]
 
+    @_ttl_cached
     def get_launch_history(self, slug: str, use_estimate: bool = False) -> List[Dict]:
         """
         Get launch history for a constellation.
         Returns list of launches with aggregated satellite stats.
         """
-        constellation = Constellation.query.filter_by(slug=slug).first()
-        if not constellation:
+        cid = self._get_constellation_id(slug)
+        if cid is None:
             return []
             
-        # We need launches that contain satellites from this constellation
-        launches = db.session.query(Launch, func.count(Satellite.id))\
+        # We need launches that contain satellites from this constellation,
+        # with per-launch satellite stats aggregated in the same query.
+        launches = db.session.query(Launch, *self._launch_stat_columns())\
             .join(Satellite)\
-            .filter(Satellite.constellation_id == constellation.id)\
+            .filter(Satellite.constellation_id == cid)\
             .group_by(Launch.id)\
             .order_by(Launch.launch_date.desc())\
             .all()
             
         result = []
-        for launch, count in launches:
-            sats = Satellite.query.filter_by(launch_id=launch.id, constellation_id=constellation.id).all()
-            
-            inclinations = [s.inclination for s in sats if s.inclination]
-            avg_incl = sum(inclinations)/len(inclinations) if inclinations else 0
-            
-            alts = [s.semi_major_axis_km - self.EARTH_RADIUS_KM for s in sats if s.semi_major_axis_km]
-            avg_alt = sum(alts)/len(alts) if alts else 0
-            
-            active_count = sum(1 for s in sats if s.is_active)
-            
+        for launch, count, active_count, avg_alt, avg_incl in launches:
             result.append({
                 'launch_id': launch.id,
                 'cospar_id': launch.cospar_id,
@@ -228,53 +451,92 @@ class StatisticsService:
                 'rocket': launch.rocket_type or 'Unknown',
                 'status': 'success' if launch.launch_success else 'failure',
                 'count': count,
-                'active_count': active_count,
-                'avg_altitude_km': round(avg_alt, 1),
-                'avg_inclination_deg': round(avg_incl, 1)
+                'active_count': active_count or 0,
+                'avg_altitude_km': round(avg_alt or 0, 1),
+                'avg_inclination_deg': round(avg_incl or 0, 1)
             })
 
         if result or not use_estimate:
             return result
 
-        # Fallback: build synthetic launch groups from satellites if Launch table is empty
-        sats = Satellite.query.filter_by(constellation_id=constellation.id).all()
-        if not sats:
-            return []
+        # Fallback: build synthetic launch groups from satellites if Launch table is empty.
+        # Satellites with a full COSPAR designator are grouped and aggregated in SQL;
+        # only the rest need per-satellite launch-date estimates in Python.
+        launch_key = func.substr(Satellite.intl_designator, 1, 8)
+        has_designator = func.length(Satellite.intl_designator) >= 8
 
-        first_epoch_map = self._get_first_epoch_map(constellation.id)
+        # key -> [first satellite id, count, active_count, avg_alt, avg_incl, est_date]
         grouped = {}
-        for s in sats:
-            launch_key = None
-            if s.intl_designator and len(s.intl_designator) >= 8:
-                launch_key = s.intl_designator[:8]
-            else:
-                est_date = self._estimate_launch_date(s, first_epoch_map)
-                launch_key = est_date.strftime('%Y') if est_date else 'Unknown'
+        undated = []
+        rows = db.session.query(launch_key, func.min(Satellite.id), *self._launch_stat_columns())\
+            .filter(Satellite.constellation_id == cid, has_designator)\
+            .group_by(launch_key)\
+            .all()
+        for key, first_id, count, active_count, avg_alt, avg_incl in rows:
+            est_date = None
+            if '-' in key:
+                try:
+                    est_date = datetime(int(key[:4]), 1, 1)
+                except ValueError:
+                    est_date = None
+            if not est_date:
+                undated.append(key)
+            grouped[key] = [first_id, count, active_count or 0, avg_alt or 0, avg_incl or 0, est_date]
 
-            grouped.setdefault(launch_key, []).append(s)
+        columns = (
+            Satellite.id,
+            Satellite.intl_designator,
+            Satellite.launch_date,
+            Satellite.tle_epoch,
+            Satellite.inclination,
+            Satellite.semi_major_axis_km,
+            Satellite.is_active
+        )
+        sats = db.session.query(*columns)\
+            .filter(Satellite.constellation_id == cid,
+                    or_(Satellite.intl_designator.is_(None), ~has_designator))\
+            .all()
+        if undated:
+            undated_sats = db.session.query(*columns)\
+                .filter(Satellite.constellation_id == cid, has_designator,
+                        launch_key.in_(undated))\
+                .all()
+        else:
+            undated_sats = []
 
-        fallback = []
-        for key, group in grouped.items():
+        if not grouped and not sats:
+            return []
+
+        if sats or undated_sats:
+            first_epoch_map = self._get_first_epoch_map(cid)
+            estimates = self._estimate_launch_dates(sats + undated_sats, first_epoch_map)
+
+        # Groups whose designator carries no usable year take the earliest estimate
+        for s in undated_sats:
+            est_date = estimates[s.id]
+            group = grouped[s.intl_designator[:8]]
+            if est_date and (not group[5] or est_date < group[5]):
+                group[5] = est_date
+
+        by_year = {}
+        for s in sats:
+            est_date = estimates[s.id]
+            by_year.setdefault(est_date.strftime('%Y') if est_date else 'Unknown', []).append(s)
+
+        for key, group in by_year.items():
             inclinations = [s.inclination for s in group if s.inclination]
             avg_incl = sum(inclinations) / len(inclinations) if inclinations else 0
             alts = [s.semi_major_axis_km - self.EARTH_RADIUS_KM for s in group if s.semi_major_axis_km]
             avg_alt = sum(alts) / len(alts) if alts else 0
             active_count = sum(1 for s in group if s.is_active)
+            epochs = [estimates[s.id] for s in group if estimates[s.id]]
+            est_date = min(epochs) if epochs else None
+            grouped[key] = [min(s.id for s in group), len(group), active_count, avg_alt, avg_incl, est_date]
 
-            # Use estimated date if possible
-            est_date = None
-            if key != 'Unknown' and '-' in key:
-                try:
-                    year = int(key[:4])
-                    est_date = datetime(year, 1, 1)
-                except ValueError:
-                    est_date = None
-            if not est_date:
-                # Use earliest epoch in group
-                epochs = [self._estimate_launch_date(s, first_epoch_map) for s in group]
-                epochs = [e for e in epochs if e]
-                est_date = min(epochs) if epochs else None
-
+        fallback = []
+        # Keep groups in order of first appearance so equal dates sort stably
+        for key, (_, count, active_count, avg_alt, avg_incl, est_date) in sorted(
+                grouped.items(), key=lambda item: item[1][0]):
             fallback.append({
                 'launch_id': None,
                 'cospar_id': key if key != 'Unknown' else None,
@@ -283,7 +545,7 @@ class StatisticsService:
                 'site': 'Unknown',
                 'rocket': 'Unknown',
                 'status': 'success',
-                'count': len(group),
+                'count': count,
                 'active_count': active_count,
                 'avg_altitude_km': round(avg_alt, 1),
                 'avg_inclination_deg': round(avg_incl, 1)
@@ -293,6 +555,23 @@ class StatisticsService:
         fallback.sort(key=lambda r: r['date'] or '', reverse=True)
         return fallback
 
+    def _launch_stat_columns(self):
+        """
+        Per-launch aggregate columns: satellite count, active count,
+        average altitude and average inclination.
+
+        CASE without ELSE yields NULL, which AVG skips (zero/missing
+        inclination and semi-major axis are left out of the averages).
+        """
+        return (
+            func.count(Satellite.id),
+            func.sum(case((Satellite.is_active, 1), else_=0)),
+            func.avg(case((Satellite.semi_major_axis_km != 0,
+                           Satellite.semi_major_axis_km - self.EARTH_RADIUS_KM))),
+            func.avg(case((Satellite.inclination != 0, Satellite.inclination)))
+        )
+
+    @_ttl_cached
     def get_constellation_growth(self, slug: str, use_estimate: bool = False) -> List[Dict]:
         """
         Get historical satellite counts over time.
@@ -301,69 +580,54 @@ class StatisticsService:
         Always uses estimation from intl_designator when launch_date is missing,
         since Space-Track SATCAT data may not be fully synced.
         """
-        constellation = Constellation.query.filter_by(slug=slug).first()
-        if not constellation:
+        cid = self._get_constellation_id(slug)
+        if cid is None:
             return []
             
-        sats = Satellite.query.filter_by(constellation_id=constellation.id).all()
+        # Satellites with a real launch_date and all decays are counted per
+        # day in SQL; only undated satellites need a launch-date estimate
+        launch_days = db.session.query(Satellite.launch_date, func.count(Satellite.id))\
+            .filter(Satellite.constellation_id == cid, Satellite.launch_date.isnot(None))\
+            .group_by(Satellite.launch_date)\
+            .all()
+        decay_days = db.session.query(Satellite.decay_date, func.count(Satellite.id))\
+            .filter(Satellite.constellation_id == cid, Satellite.decay_date.isnot(None))\
+            .group_by(Satellite.decay_date)\
+            .all()
+        undated = db.session.query(
+                Satellite.id,
+                Satellite.intl_designator,
+                Satellite.launch_date,
+                Satellite.tle_epoch
+            )\
+            .filter(Satellite.constellation_id == cid, Satellite.launch_date.is_(None))\
+            .all()
         
-        # Build events: (date, event_type)
-        # event_type: 'launch' or 'decay'
-        events = []
-        first_epoch_map = self._get_first_epoch_map(constellation.id) if sats else {}
+        first_epoch_map = self._get_first_epoch_map(cid) if undated else {}
+        estimates = self._estimate_launch_dates(undated, first_epoch_map)
+        estimated = [est.date() for est in estimates.values() if est]
         
-        for s in sats:
-            # Try real launch_date first, then estimate from intl_designator
-            launch_dt = None
-            if s.launch_date:
-                launch_dt = s.launch_date
-            else:
-                est = self._estimate_launch_date(s, first_epoch_map)
-                if est:
-                    launch_dt = est.date()
-            
-            if launch_dt:
-                events.append((launch_dt, 'launch'))
-            
-            if s.decay_date:
-                events.append((s.decay_date, 'decay'))
-
-        # Sort by date
-        events.sort(key=lambda x: x[0])
+        launch_dates = [day for day, _ in launch_days] + estimated
+        launch_counts = [count for _, count in launch_days] + [1] * len(estimated)
         
-        data = []
-        total_launched = 0
-        total_decayed = 0
-        current_date = None
+        dates, launched, decayed = _cumulative_counts(
+            np.array(launch_dates, dtype='datetime64[D]'),
+            np.array([day for day, _ in decay_days], dtype='datetime64[D]'),
+            np.array(launch_counts, dtype=np.float64),
+            np.array([count for _, count in decay_days], dtype=np.float64)
+        )
         
-        for date, event_type in events:
-            date_str = date.isoformat()
-            
-            # Save previous day's data before changing date
-            if date_str != current_date:
-                if current_date is not None:
-                    data.append({
-                        'date': current_date,
-                        'total': total_launched,
-                        'decayed': total_decayed,
-                        'active': total_launched - total_decayed
-                    })
-                current_date = date_str
-            
-            # Update counters
-            if event_type == 'launch':
-                total_launched += 1
-            elif event_type == 'decay':
-                total_decayed += 1
-            
-        # Add final entry
-        if current_date:
-            data.append({
-                'date': current_date,
-                'total': total_launched,
-                'decayed': total_decayed,
-                'active': total_launched - total_decayed
-            })
+        data = [{
+            'date': date_str,
+            'total': total,
+            'decayed': dead,
+            'active': total - dead
+        } for date_str, total, dead in zip(
+            np.datetime_as_string(dates).tolist(), launched.tolist(), decayed.tolist()
+        )]
+        
+        total_launched = int(launched[-1]) if len(dates) else 0
+        total_decayed = int(decayed[-1]) if len(dates) else 0
             
         # Add today's snapshot
         today = datetime.utcnow().date().isoformat()
@@ -377,26 +641,44 @@ class StatisticsService:
             
         return data
 
+    @_ttl_cached
     def get_decay_history(self, slug: str) -> List[Dict]:
         """
         Get list of decayed satellites.
         """
-        constellation = Constellation.query.filter_by(slug=slug).first()
-        if not constellation:
-            return []
+        return list(self.iter_decay_history(slug))
+
+    def iter_decay_history(self, slug: str) -> Iterator[Dict]:
+        """
+        Yield decayed satellites, most recent decay first.
+        """
+        cid = self._get_constellation_id(slug)
+        if cid is None:
+            return
             
-        decayed_sats = Satellite.query.filter(
-            Satellite.constellation_id == constellation.id,
-            Satellite.decay_date.isnot(None)
-        ).order_by(Satellite.decay_date.desc()).all()
+        decayed_sats = db.session.query(
+                Satellite.norad_id,
+                Satellite.name,
+                Satellite.intl_designator,
+                Satellite.decay_date,
+                Satellite.launch_date
+            )\
+            .filter(
+                Satellite.constellation_id == cid,
+                Satellite.decay_date.isnot(None)
+            )\
+            .order_by(Satellite.decay_date.desc())\
+            .yield_per(2000)
         
-        return [{
-            'norad_id': s.norad_id,
-            'name': s.name,
-            'intl_designator': s.intl_designator,
-            'decay_date': s.decay_date.isoformat(),
-            'launch_date': s.launch_date.isoformat() if s.launch_date else None,
-            'reason': 'decayed'
-        } for s in decayed_sats]
+        iso_dates = _IsoDates()
+        for s in decayed_sats:
+            yield {
+                'norad_id': s.norad_id,
+                'name': s.name,
+                'intl_designator': s.intl_designator,
+                'decay_date': iso_dates[s.decay_date],
+                'launch_date': iso_dates[s.launch_date] if s.launch_date else None,
+                'reason': 'decayed'
+            }
 
 statistics_service = StatisticsService()
@@ -11,18 +11,39 @@ Features:
 - Orbital parameter calculations
 """
 
+import functools
 import math
+import re
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Set, Tuple
+import numpy as np
 
 from models import db, Constellation, Satellite, TLEHistory, Launch
 from config import Config
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 
 from services.spacetrack_service import spacetrack_service
 
+# "OBJECT_NAME~~STARLINK,OBJECT_NAME~~FLOCK" -> each value up to the next comma
+_NAME_PATTERN_RE = re.compile(r'OBJECT_NAME~~([^,]*)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _epoch_from_field(epoch_str: str) -> Optional[datetime]:
+    """Convert a stripped TLE epoch field ('YYDDD.DDDDDDDD') to a datetime."""
+    try:
+        year_2digit = int(epoch_str[:2])
+        day_fraction = float(epoch_str[2:])
+
+        year = 2000 + year_2digit if year_2digit < 57 else 1900 + year_2digit
+        
+        return datetime(year, 1, 1) + timedelta(days=day_fraction - 1)
+    except (ValueError, IndexError):
+        return None
+
 
 class TLEService:
     """
@@ -38,39 +59,66 @@ class TLEService:
     # Earth constants for orbital calculations
     EARTH_RADIUS_KM = 6378.137
     EARTH_MU = 398600.4418  # km^3/s^2
+    # Kepler's third law: a^3 = MU * T^2 / (4 pi^2)
+    EARTH_MU_OVER_4PI2 = EARTH_MU / (4 * math.pi * math.pi)
     
     # Rate limiting (managed by SpaceTrackService, but we track per-constellation)
     RATE_LIMIT_SECONDS = 3600          # 1 hour between same GP queries
     SATCAT_RATE_LIMIT_SECONDS = 86400  # 24 hours between SATCAT queries
     HISTORY_RATE_LIMIT_SECONDS = 604800  # 7 days between history backfills
+    UPDATE_MAX_WORKERS = 4             # Constellations fetched concurrently by update_all
+    
+    # Max bound parameters per IN (...) clause (SQLite's old default limit is 999)
+    MAX_IN_PARAMS = 900
     
     # History settings
     HISTORY_DAYS_DEFAULT = Config.HISTORY_DAYS_DEFAULT
     HISTORY_BATCH_SIZE = Config.HISTORY_BATCH_SIZE
+    # TLEHistory rows per bulk insert (16 columns each, well under the
+    # 65535 bind-parameter limit and typical max_allowed_packet sizes)
+    HISTORY_INSERT_CHUNK_SIZE = 1000
+    
+    # TLE line 2 strings whose orbital parameters are kept between parses
+    ORBITAL_PARAMS_CACHE_SIZE = 65536
+    
+    # Satellite metadata columns filled from SATCAT records
+    SATCAT_METADATA_COLUMNS = (
+        'intl_designator', 'launch_date', 'decay_date',
+        'country_code', 'rcs_size', 'object_type',
+    )
+    
+    # Satellite columns refreshed when a GP record is upserted
+    GP_UPDATE_COLUMNS = (
+        'name', 'constellation_id', 'tle_line1', 'tle_line2', 'tle_epoch',
+        'intl_designator', 'period_minutes', 'inclination', 'apogee_km',
+        'perigee_km', 'eccentricity', 'semi_major_axis_km', 'mean_motion',
+        'tle_updated_at', 'is_active', 'decay_date',
+    )
 
     def __init__(self):
         self.constellations = Config.CONSTELLATIONS
-        self._rate_limit_lock = Lock()
-        self._last_fetch_time = {}  # {key: timestamp}
+        # {key: timestamp}; plain dict reads/writes are atomic, and a race
+        # at worst lets one extra advisory-limited request through
+        self._last_fetch_time = {}
+        self._constellation_ids = {}  # {slug: constellation id}
+        self._orbital_params = {}  # {TLE line 2: orbital parameter dict}
 
     # ==================== Rate Limiting ====================
     
     def _check_rate_limit(self, key: str, limit_seconds: int) -> bool:
         """Check if we can make another API call."""
-        with self._rate_limit_lock:
-            last_time = self._last_fetch_time.get(key, 0)
-            current_time = time.time()
-            
-            if current_time - last_time < limit_seconds:
-                remaining = int(limit_seconds - (current_time - last_time))
-                print(f"[TLEService] Rate limited for {key}: {remaining}s remaining", flush=True)
-                return False
-            return True
+        last_time = self._last_fetch_time.get(key, 0)
+        current_time = time.time()
+        
+        if current_time - last_time < limit_seconds:
+            remaining = int(limit_seconds - (current_time - last_time))
+            print(f"[TLEService] Rate limited for {key}: {remaining}s remaining", flush=True)
+            return False
+        return True
             
     def _update_rate_limit(self, key: str):
         """Update the last fetch time for rate limiting."""
-        with self._rate_limit_lock:
-            self._last_fetch_time[key] = time.time()
+        self._last_fetch_time[key] = time.time()
 
     # ==================== Constellation Management ====================
 
@@ -79,9 +127,21 @@ class TLEService:
         if slug not in self.constellations:
             return None
         
+        # Primary-key lookup hits the session identity map when the row is loaded
+        constellation_id = self._constellation_ids.get(slug)
+        if constellation_id is not None:
+            constellation = db.session.get(Constellation, constellation_id)
+            if constellation is not None and constellation.slug == slug:
+                return constellation
+            self._constellation_ids.pop(slug, None)
+        
         constellation = Constellation.query.filter_by(slug=slug).first()
         
-        if not constellation:
+        # Only cache rows that already existed; a freshly flushed one may
+        # still be rolled back
+        if constellation:
+            self._constellation_ids[slug] = constellation.id
+        else:
             config = self.constellations[slug]
             constellation = Constellation(
                 name=config["name"],
@@ -111,18 +171,33 @@ class TLEService:
         if constellation_slug not in self.constellations:
             raise ValueError(f"Unknown constellation: {constellation_slug}")
 
+        gp_data = self._fetch_constellation_gp(constellation_slug)
+        if not gp_data:
+            return (0, 0)
+        
+        return self._apply_constellation_gp(constellation_slug, gp_data)
+    
+    def _fetch_constellation_gp(self, constellation_slug: str) -> Optional[List[Dict]]:
+        """
+        Fetch current GP records for a constellation from Space-Track.
+        
+        Touches no database state, so it can run on worker threads.
+        
+        Returns:
+            List of GP records, or None if rate limited, unconfigured or failed
+        """
         # Check rate limit
         rate_key = f"gp:{constellation_slug}"
         if not self._check_rate_limit(rate_key, self.RATE_LIMIT_SECONDS):
             print(f"[TLEService] Skipping {constellation_slug} due to rate limit", flush=True)
-            return (0, 0)
+            return None
         
         config = self.constellations[constellation_slug]
         query = config.get('spacetrack_query')
         
         if not query:
             print(f"[TLEService] No Space-Track query configured for {constellation_slug}", flush=True)
-            return (0, 0)
+            return None
         
         # NOTE: Do NOT filter by DECAY_DATE here - we want ALL satellites (active + decayed)
         # to match satellitemap.space counts. The frontend API filters by is_active for display.
@@ -158,17 +233,26 @@ class TLEService:
             print(f"[TLEService] Error fetching GP data: {e}", flush=True)
             import traceback
             traceback.print_exc()
-            return (0, 0)
+            return None
         
         if not gp_data:
             print(f"[TLEService] No GP data returned for {constellation_slug}", flush=True)
-            return (0, 0)
+            return None
         
         print(f"[TLEService] Received {len(gp_data)} GP records", flush=True)
         
         # Update rate limit after successful fetch
         self._update_rate_limit(rate_key)
         
+        return gp_data
+    
+    def _apply_constellation_gp(self, constellation_slug: str, gp_data: List[Dict]) -> Tuple[int, int]:
+        """
+        Store fetched GP records for a constellation and refresh its counters.
+        
+        Returns:
+            Tuple of (new_count, updated_count)
+        """
         # Get or create constellation
         constellation = self.get_or_create_constellation(constellation_slug)
         if not constellation:
@@ -177,10 +261,11 @@ class TLEService:
         # Process and store data
         new_count, updated_count = self._store_gp_data(gp_data, constellation)
         
-        # Update constellation satellite count
-        constellation.satellite_count = Satellite.query.filter_by(
-            constellation_id=constellation.id
-        ).count()
+        # Update constellation satellite count. Recount rather than add
+        # new_count: the upsert can also move satellites between constellations
+        constellation.satellite_count = db.session.query(func.count(Satellite.id))\
+            .filter(Satellite.constellation_id == constellation.id)\
+            .scalar()
         constellation.updated_at = datetime.utcnow()
         
         db.session.commit()
@@ -198,22 +283,17 @@ class TLEService:
         Returns:
             List of pattern strings like ["STARLINK", "FLOCK"]
         """
-        patterns = []
-        parts = query.split(',')
-        
-        for part in parts:
-            part = part.strip()
-            if 'OBJECT_NAME~~' in part:
-                pattern = part.split('OBJECT_NAME~~')[1].strip()
-                if pattern:
-                    patterns.append(pattern)
-        
-        return patterns
+        return [pattern.strip() for pattern in _NAME_PATTERN_RE.findall(query) if pattern.strip()]
 
     def _store_gp_data(self, gp_data: List[Dict], constellation: Constellation) -> Tuple[int, int]:
         """
         Store GP data in the database.
         
+        Existing satellites are preloaded in one query and all satellite rows
+        are written with a single bulk upsert keyed on norad_id. History rows
+        for changed epochs are inserted together afterwards, skipping epochs
+        the history already holds.
+        
         Args:
             gp_data: List of GP records from Space-Track
             constellation: Constellation object
@@ -223,6 +303,22 @@ class TLEService:
         """
         new_count = 0
         updated_count = 0
+        now = datetime.utcnow()
+        
+        norad_ids = {int(r['NORAD_CAT_ID']) for r in gp_data if r.get('NORAD_CAT_ID')}
+        if not norad_ids:
+            return (0, 0)
+        
+        existing = self._query_in_chunks(
+            db.session.query(Satellite.norad_id, Satellite.id, Satellite.tle_epoch, Satellite.name),
+            Satellite.norad_id, norad_ids
+        )
+        sat_ids = {norad_id: sat_id for norad_id, sat_id, _, _ in existing}
+        # norad_id -> (tle_epoch, name) as of the records processed so far
+        current = {norad_id: (epoch, name) for norad_id, _, epoch, name in existing}
+        
+        rows = {}  # norad_id -> satellite column values (last record wins)
+        history = []  # (norad_id, record, epoch, row) for TLEs whose epoch changed
         
         for record in gp_data:
             norad_id = record.get('NORAD_CAT_ID')
@@ -246,93 +342,239 @@ class TLEService:
             
             if decay_date_str:
                 try:
-                    decay_date = datetime.strptime(decay_date_str[:10], '%Y-%m-%d').date()
+                    decay_date = self._parse_date(decay_date_str[:10])
                     is_active = False
                 except (ValueError, TypeError):
                     pass
             
-            # Get existing satellite or create new
-            satellite = Satellite.query.filter_by(norad_id=norad_id).first()
-            
-            if satellite:
-                old_epoch = satellite.tle_epoch
-                
-                # Update satellite
-                satellite.name = record.get('OBJECT_NAME', satellite.name)
-                satellite.tle_line1 = record.get('TLE_LINE1')
-                satellite.tle_line2 = record.get('TLE_LINE2')
-                satellite.tle_epoch = epoch
-                satellite.intl_designator = record.get('INTLDES')
-                satellite.period_minutes = period_minutes
-                satellite.inclination = float(record.get('INCLINATION', 0))
-                satellite.apogee_km = float(record.get('APOAPSIS', 0))
-                satellite.perigee_km = float(record.get('PERIAPSIS', 0))
-                satellite.eccentricity = float(record.get('ECCENTRICITY', 0))
-                satellite.semi_major_axis_km = float(record.get('SEMIMAJOR_AXIS', 0))
-                satellite.mean_motion = mean_motion
-                satellite.tle_updated_at = datetime.utcnow()
-                satellite.constellation_id = constellation.id
-                satellite.is_active = is_active
-                satellite.decay_date = decay_date
+            add_history = False
+            if norad_id in current:
+                old_epoch, name = current[norad_id]
+                name = record.get('OBJECT_NAME', name)
                 
                 # Add to history if epoch changed
-                if old_epoch != epoch and record.get('TLE_LINE1') and record.get('TLE_LINE2'):
-                    self._add_to_history(satellite, record, epoch, 'SpaceTrack_Update')
+                add_history = (old_epoch != epoch and bool(record.get('TLE_LINE1'))
+                               and bool(record.get('TLE_LINE2')))
                 
                 updated_count += 1
             else:
-                # Create new satellite
-                satellite = Satellite(
-                    norad_id=norad_id,
-                    name=record.get('OBJECT_NAME', f"Unknown-{norad_id}"),
-                    constellation_id=constellation.id,
-                    tle_line1=record.get('TLE_LINE1'),
-                    tle_line2=record.get('TLE_LINE2'),
-                    tle_epoch=epoch,
-                    intl_designator=record.get('INTLDES'),
-                    period_minutes=period_minutes,
-                    inclination=float(record.get('INCLINATION', 0)),
-                    apogee_km=float(record.get('APOAPSIS', 0)),
-                    perigee_km=float(record.get('PERIAPSIS', 0)),
-                    eccentricity=float(record.get('ECCENTRICITY', 0)),
-                    semi_major_axis_km=float(record.get('SEMIMAJOR_AXIS', 0)),
-                    mean_motion=mean_motion,
-                    tle_updated_at=datetime.utcnow(),
-                    is_active=is_active,
-                    decay_date=decay_date,
-                )
-                db.session.add(satellite)
+                name = record.get('OBJECT_NAME', f"Unknown-{norad_id}")
                 new_count += 1
+            current[norad_id] = (epoch, name)
+            
+            row = rows[norad_id] = {
+                'norad_id': norad_id,
+                'name': name,
+                'constellation_id': constellation.id,
+                'tle_line1': record.get('TLE_LINE1'),
+                'tle_line2': record.get('TLE_LINE2'),
+                'tle_epoch': epoch,
+                'intl_designator': record.get('INTLDES'),
+                'period_minutes': period_minutes,
+                'inclination': float(record.get('INCLINATION', 0)),
+                'apogee_km': float(record.get('APOAPSIS', 0)),
+                'perigee_km': float(record.get('PERIAPSIS', 0)),
+                'eccentricity': float(record.get('ECCENTRICITY', 0)),
+                'semi_major_axis_km': float(record.get('SEMIMAJOR_AXIS', 0)),
+                'mean_motion': mean_motion,
+                'tle_updated_at': now,
+                'is_active': is_active,
+                'decay_date': decay_date,
+            }
+            if add_history:
+                history.append((norad_id, record, epoch, row))
+        
+        stmt = self._upsert_statement(Satellite.__table__, ['norad_id'], self.GP_UPDATE_COLUMNS)
+        if stmt is not None:
+            db.session.execute(stmt, list(rows.values()))
+        else:
+            # No bulk upsert for this dialect: update preloaded rows, add new ones
+            sat_map = {s.norad_id: s for s in self._query_in_chunks(
+                Satellite.query, Satellite.norad_id, rows
+            )}
+            for norad_id, row in rows.items():
+                satellite = sat_map.get(norad_id)
+                if satellite is None:
+                    db.session.add(Satellite(**row))
+                else:
+                    for column in self.GP_UPDATE_COLUMNS:
+                        setattr(satellite, column, row[column])
+            db.session.flush()
+        
+        if history:
+            # Satellites created earlier in this batch only have an id now
+            missing = {entry[0] for entry in history if entry[0] not in sat_ids}
+            if missing:
+                sat_ids.update(self._query_in_chunks(
+                    db.session.query(Satellite.norad_id, Satellite.id),
+                    Satellite.norad_id, missing
+                ))
+            history_rows = []
+            for norad_id, record, epoch, row in history:
+                try:
+                    history_rows.append(
+                        self._history_mapping(sat_ids[norad_id], record, epoch,
+                                              'SpaceTrack_Update', converted=row)
+                    )
+                except Exception as e:
+                    print(f"[TLEService] Error adding to history: {e}")
+            self._insert_history_rows(history_rows)
         
         return (new_count, updated_count)
 
-    def _add_to_history(self, satellite: Satellite, record: Dict, epoch: datetime, source: str):
-        """Add a TLE record to history."""
-        try:
-            mean_motion = float(record.get('MEAN_MOTION', 0))
-            period_minutes = 1440.0 / mean_motion if mean_motion > 0 else None
-            
-            history = TLEHistory(
-                satellite_id=satellite.id,
-                tle_line1=record.get('TLE_LINE1'),
-                tle_line2=record.get('TLE_LINE2'),
-                epoch=epoch,
-                source=source,
-                semi_major_axis_km=float(record.get('SEMIMAJOR_AXIS', 0)),
-                mean_motion=mean_motion,
-                eccentricity=float(record.get('ECCENTRICITY', 0)),
-                inclination=float(record.get('INCLINATION', 0)),
-                apogee_km=float(record.get('APOAPSIS', 0)),
-                perigee_km=float(record.get('PERIAPSIS', 0)),
-                period_minutes=period_minutes,
-                bstar=float(record.get('BSTAR', 0)),
-                mean_anomaly=float(record.get('MEAN_ANOMALY', 0)),
-                raan=float(record.get('RA_OF_ASC_NODE', 0)),
-                arg_of_perigee=float(record.get('ARG_OF_PERICENTER', 0)),
+    def _query_in_chunks(self, query, column, values) -> List:
+        """
+        Run query filtered by column IN values, issuing one query per
+        MAX_IN_PARAMS values so large ID lists stay under driver limits.
+        
+        Returns:
+            All result rows concatenated
+        """
+        values = list(values)
+        results = []
+        for i in range(0, len(values), self.MAX_IN_PARAMS):
+            results.extend(query.filter(column.in_(values[i:i + self.MAX_IN_PARAMS])).all())
+        return results
+
+    def _upsert_statement(self, table, index_elements: List[str], update_columns: Tuple[str, ...]):
+        """
+        Build an INSERT that updates update_columns when a row with the same
+        index_elements already exists (ON CONFLICT / ON DUPLICATE KEY UPDATE).
+        
+        Execute it with a list of row dicts to upsert them in one statement.
+        Returns None for dialects without such a statement; callers then
+        fall back to the ORM.
+        """
+        dialect = db.session.get_bind().dialect.name
+        
+        if dialect in ('postgresql', 'sqlite'):
+            insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+            stmt = insert(table)
+            return stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={c: stmt.excluded[c] for c in update_columns}
             )
-            db.session.add(history)
-        except Exception as e:
-            print(f"[TLEService] Error adding to history: {e}")
+        if dialect in ('mysql', 'mariadb'):
+            stmt = mysql.insert(table)
+            return stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in update_columns})
+        
+        return None
+
+    def _insert_ignore_statement(self, table, index_elements: List[str]):
+        """
+        Build an INSERT that skips rows whose index_elements already exist
+        (ON CONFLICT DO NOTHING / INSERT IGNORE), or None for dialects
+        without such a statement (see _insert_new_rows).
+        """
+        dialect = db.session.get_bind().dialect.name
+        
+        if dialect in ('postgresql', 'sqlite'):
+            insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+            return insert(table).on_conflict_do_nothing(index_elements=index_elements)
+        if dialect in ('mysql', 'mariadb'):
+            return mysql.insert(table).prefix_with('IGNORE')
+        
+        return None
+
+    def _insert_new_rows(self, model, rows: List[Dict], key_columns: Tuple[str, ...],
+                         existing_keys: Set[tuple]) -> List[Dict]:
+        """
+        ORM fallback for _insert_ignore_statement: bulk insert the rows whose
+        key_columns are neither in existing_keys nor repeated earlier in rows.
+        
+        Returns:
+            The rows inserted
+        """
+        seen = set(existing_keys)
+        new_rows = []
+        for row in rows:
+            key = tuple(row[c] for c in key_columns)
+            if key not in seen:
+                seen.add(key)
+                new_rows.append(row)
+        if new_rows:
+            db.session.bulk_insert_mappings(model, new_rows)
+        return new_rows
+
+    def _history_mapping(self, satellite_id: int, record: Dict, epoch: datetime, source: str,
+                         converted: Optional[Dict] = None) -> Dict:
+        """
+        Build a TLEHistory row (as a dict for bulk_insert_mappings) from a GP record.
+        
+        Args:
+            satellite_id: Satellite primary key
+            record: GP / GP_HISTORY record from Space-Track
+            epoch: Parsed EPOCH of the record
+            source: History source label
+            converted: Satellite row already built from this record; its
+                orbital values are reused instead of converting them again
+        """
+        get = record.get
+        if converted is None:
+            mean_motion = float(get('MEAN_MOTION', 0))
+            converted = {
+                'semi_major_axis_km': float(get('SEMIMAJOR_AXIS', 0)),
+                'mean_motion': mean_motion,
+                'eccentricity': float(get('ECCENTRICITY', 0)),
+                'inclination': float(get('INCLINATION', 0)),
+                'apogee_km': float(get('APOAPSIS', 0)),
+                'perigee_km': float(get('PERIAPSIS', 0)),
+                'period_minutes': 1440.0 / mean_motion if mean_motion > 0 else None,
+            }
+        
+        return {
+            'satellite_id': satellite_id,
+            'tle_line1': get('TLE_LINE1'),
+            'tle_line2': get('TLE_LINE2'),
+            'epoch': epoch,
+            'source': source,
+            'semi_major_axis_km': converted['semi_major_axis_km'],
+            'mean_motion': converted['mean_motion'],
+            'eccentricity': converted['eccentricity'],
+            'inclination': converted['inclination'],
+            'apogee_km': converted['apogee_km'],
+            'perigee_km': converted['perigee_km'],
+            'period_minutes': converted['period_minutes'],
+            'bstar': float(get('BSTAR', 0)),
+            'mean_anomaly': float(get('MEAN_ANOMALY', 0)),
+            'raan': float(get('RA_OF_ASC_NODE', 0)),
+            'arg_of_perigee': float(get('ARG_OF_PERICENTER', 0)),
+        }
+
+    def _insert_history_rows(self, rows: List[Dict]) -> int:
+        """
+        Insert TLEHistory row dicts in chunks of HISTORY_INSERT_CHUNK_SIZE,
+        skipping (satellite_id, epoch) pairs that are already stored
+        (ON CONFLICT DO NOTHING / INSERT IGNORE on the unique index).
+        
+        Returns:
+            Number of rows actually inserted
+        """
+        table = TLEHistory.__table__
+        stmt = self._insert_ignore_statement(table, ['satellite_id', 'epoch'])
+        if stmt is None:
+            if not rows:
+                return 0
+            # Skip epochs already stored for these satellites within the batch's span
+            existing = self._query_in_chunks(
+                db.session.query(TLEHistory.satellite_id, TLEHistory.epoch).filter(
+                    TLEHistory.epoch.between(min(r['epoch'] for r in rows),
+                                             max(r['epoch'] for r in rows))
+                ),
+                TLEHistory.satellite_id, {r['satellite_id'] for r in rows}
+            )
+            return len(self._insert_new_rows(
+                TLEHistory, rows, ('satellite_id', 'epoch'), {tuple(key) for key in existing}
+            ))
+        returning = db.session.get_bind().dialect.insert_executemany_returning
+        if returning:
+            stmt = stmt.returning(table.c.id)
+        
+        inserted = 0
+        for i in range(0, len(rows), self.HISTORY_INSERT_CHUNK_SIZE):
+            result = db.session.execute(stmt, rows[i:i + self.HISTORY_INSERT_CHUNK_SIZE])
+            inserted += len(result.all()) if returning else result.rowcount
+        return inserted
 
     # ==================== SATCAT Sync ====================
 
@@ -382,6 +624,26 @@ class TLEService:
         # Process SATCAT data
         return self._process_satcat_data(satcat_data, constellation)
 
+    def _satcat_metadata(self, item: Dict) -> Dict:
+        """Satellite column values a SATCAT record sets (only fields it provides)."""
+        metadata = {}
+        if item.get('SATNAME'):
+            metadata['name'] = item['SATNAME']
+        if item.get('INTLDES'):
+            metadata['intl_designator'] = item['INTLDES']
+        if item.get('LAUNCH'):
+            metadata['launch_date'] = self._parse_date(item['LAUNCH'])
+        if item.get('DECAY'):
+            metadata['decay_date'] = self._parse_date(item['DECAY'])
+            metadata['is_active'] = False
+        if item.get('COUNTRY'):
+            metadata['country_code'] = item['COUNTRY']
+        if item.get('RCS'):
+            metadata['rcs_size'] = item['RCS']
+        if item.get('OBJECT_TYPE'):
+            metadata['object_type'] = item['OBJECT_TYPE']
+        return metadata
+
     def _process_satcat_data(self, satcat_data: List[Dict], 
                             constellation: Constellation) -> Dict[str, int]:
         """Process and store SATCAT data."""
@@ -395,9 +657,7 @@ class TLEService:
             
             # Preload existing satellites
             norad_ids = [int(i['NORAD_CAT_ID']) for i in valid_items]
-            existing_sats = Satellite.query.filter(
-                Satellite.norad_id.in_(norad_ids)
-            ).all()
+            existing_sats = self._query_in_chunks(Satellite.query, Satellite.norad_id, norad_ids)
             sat_map = {s.norad_id: s for s in existing_sats}
             
             # Preload launches
@@ -406,79 +666,120 @@ class TLEService:
                 for item in valid_items
                 if item.get('INTLDES')
             }
-            existing_launches = Launch.query.filter(
-                Launch.cospar_id.in_(list(cospars))
-            ).all() if cospars else []
-            launch_map = {l.cospar_id: l for l in existing_launches}
+            existing_launches = self._query_in_chunks(Launch.query, Launch.cospar_id, cospars)
+            launch_ids = {l.cospar_id: l.id for l in existing_launches}
+            
+            # Satellites to link to each launch, and launch rows still to be created
+            launch_links = []
+            new_launches = {}
+            new_sats = {}  # norad_id -> row for satellites created in one bulk insert
+            sat_changes = {}  # norad_id -> columns of an existing satellite that actually change
             
             for item in valid_items:
                 norad_id = int(item['NORAD_CAT_ID'])
                 satellite = sat_map.get(norad_id)
+                metadata = self._satcat_metadata(item)
                 
-                # Create satellite if missing
-                if not satellite:
-                    satellite = Satellite(
-                        norad_id=norad_id,
-                        name=item.get('SATNAME', f"Unknown-{norad_id}"),
-                        constellation_id=constellation.id,
-                        is_active=item.get('DECAY') is None
-                    )
-                    db.session.add(satellite)
-                    sat_map[norad_id] = satellite
-                    count_new += 1
-                else:
+                if satellite:
+                    changes = sat_changes.setdefault(norad_id, {})
+                    
                     # Ensure constellation link
-                    if satellite.constellation_id != constellation.id:
-                        satellite.constellation_id = constellation.id
+                    if changes.get('constellation_id', satellite.constellation_id) != constellation.id:
+                        changes['constellation_id'] = constellation.id
                         count_updated += 1
-                
-                # Update metadata
-                if item.get('SATNAME'):
-                    satellite.name = item['SATNAME']
-                if item.get('INTLDES'):
-                    satellite.intl_designator = item['INTLDES']
-                if item.get('LAUNCH'):
-                    satellite.launch_date = datetime.strptime(item['LAUNCH'], '%Y-%m-%d').date()
-                if item.get('DECAY'):
-                    satellite.decay_date = datetime.strptime(item['DECAY'], '%Y-%m-%d').date()
-                    satellite.is_active = False
-                if item.get('COUNTRY'):
-                    satellite.country_code = item['COUNTRY']
-                if item.get('RCS'):
-                    satellite.rcs_size = item['RCS']
-                if item.get('OBJECT_TYPE'):
-                    satellite.object_type = item['OBJECT_TYPE']
+                    
+                    # Only record values that differ, so unchanged SATCAT
+                    # re-syncs issue no UPDATEs
+                    for column, value in metadata.items():
+                        if changes.get(column, getattr(satellite, column)) != value:
+                            changes[column] = value
+                    launch_date = changes.get('launch_date', satellite.launch_date)
+                else:
+                    row = new_sats.get(norad_id)
+                    if row is None:
+                        row = new_sats[norad_id] = {
+                            'norad_id': norad_id,
+                            'name': item.get('SATNAME', f"Unknown-{norad_id}"),
+                            'constellation_id': constellation.id,
+                            'is_active': item.get('DECAY') is None,
+                            'launch_id': None,
+                            **dict.fromkeys(self.SATCAT_METADATA_COLUMNS),
+                        }
+                        count_new += 1
+                    
+                    row.update(metadata)
+                    launch_date = row['launch_date']
                 
                 # Handle launch link
                 intldes = item.get('INTLDES', '')
                 launch_cospar = intldes[:8] if len(intldes) >= 8 else intldes
                 
                 if launch_cospar:
-                    launch = launch_map.get(launch_cospar)
-                    if not launch:
-                        try:
-                            with db.session.begin_nested():
-                                launch = Launch(
-                                    cospar_id=launch_cospar,
-                                    mission_name=item.get('SATNAME'),
-                                    launch_date=datetime.combine(
-                                        satellite.launch_date, datetime.min.time()
-                                    ) if satellite.launch_date else None,
-                                    launch_site=item.get('SITE'),
-                                    data_source='SpaceTrack_SATCAT',
-                                )
-                                db.session.add(launch)
-                                db.session.flush()
-                                count_launches += 1
-                            launch_map[launch_cospar] = launch
-                        except IntegrityError:
-                            db.session.rollback()
-                            launch = Launch.query.filter_by(cospar_id=launch_cospar).first()
-                            if launch:
-                                launch_map[launch_cospar] = launch
-                    
-                    if launch:
-                        satellite.launch_id = launch.id
+                    launch_links.append((norad_id, launch_cospar))
+                    if launch_cospar not in launch_ids and launch_cospar not in new_launches:
+                        new_launches[launch_cospar] = {
+                            'cospar_id': launch_cospar,
+                            'mission_name': item.get('SATNAME'),
+                            'launch_date': datetime.combine(
+                                launch_date, datetime.min.time()
+                            ) if launch_date else None,
+                            'launch_site': item.get('SITE'),
+                            'data_source': 'SpaceTrack_SATCAT',
+                        }
+            
+            if new_launches:
+                # Create all missing launches in one statement; rows another
+                # sync inserted concurrently are skipped and selected below
+                stmt = self._insert_ignore_statement(Launch.__table__, ['cospar_id'])
+                if stmt is None:
+                    launch_ids.update(self._query_in_chunks(
+                        db.session.query(Launch.cospar_id, Launch.id),
+                        Launch.cospar_id, new_launches
+                    ))
+                    count_launches = len(self._insert_new_rows(
+                        Launch, list(new_launches.values()), ('cospar_id',),
+                        {(cospar_id,) for cospar_id in launch_ids}
+                    ))
+                elif db.session.get_bind().dialect.insert_executemany_returning:
+                    table = Launch.__table__
+                    inserted = db.session.execute(
+                        stmt.returning(table.c.cospar_id, table.c.id),
+                        list(new_launches.values())
+                    ).all()
+                    launch_ids.update(inserted)
+                    count_launches = len(inserted)
+                else:
+                    count_launches = db.session.execute(stmt, list(new_launches.values())).rowcount
+                
+                missing = [c for c in new_launches if c not in launch_ids]
+                if missing:
+                    launch_ids.update(self._query_in_chunks(
+                        db.session.query(Launch.cospar_id, Launch.id),
+                        Launch.cospar_id, missing
+                    ))
+            
+            for norad_id, launch_cospar in launch_links:
+                launch_id = launch_ids.get(launch_cospar)
+                if not launch_id:
+                    continue
+                if norad_id in new_sats:
+                    new_sats[norad_id]['launch_id'] = launch_id
+                else:
+                    changes = sat_changes[norad_id]
+                    if changes.get('launch_id', sat_map[norad_id].launch_id) != launch_id:
+                        changes['launch_id'] = launch_id
+            
+            updates = [
+                dict(changes, id=sat_map[norad_id].id)
+                for norad_id, changes in sat_changes.items()
+                if changes
+            ]
+            if updates:
+                db.session.bulk_update_mappings(Satellite, updates)
+            
+            # New satellites go in last, already carrying their metadata and launch link
+            if new_sats:
+                db.session.bulk_insert_mappings(Satellite, list(new_sats.values()))
             
             db.session.commit()
             
@@ -496,7 +797,8 @@ class TLEService:
     HISTORY_CHUNK_DAYS = 30          # Download 30 days at a time
     HISTORY_BATCH_SATELLITES = 50    # Process 50 satellites per batch
     HISTORY_DELAY_BETWEEN_BATCHES = 60  # 1 minute between batches
-    HISTORY_DELAY_BETWEEN_CHUNKS = 120  # 2 minutes between time chunks
+    HISTORY_DELAY_BETWEEN_CHUNKS = 120  # 2 minutes between time chunk requests
+    HISTORY_CHUNK_WORKERS = 2        # Time chunks downloading at once
 
     # History data cutoff: Data up to end of 2025 is imported from cloud storage.
     # Only use GP_HISTORY API for data from 2026 onwards.
@@ -575,22 +877,29 @@ class TLEService:
         print(f"[TLEService] Total satellites: {total_satellites}", flush=True)
         print(f"[TLEService] API date range: {target_start.date()} to {now.date()} (pre-2026 data from cloud storage)", flush=True)
         
+        # Find the oldest TLE we have for each satellite in one grouped query
+        oldest_epochs = dict(
+            db.session.query(TLEHistory.satellite_id, func.min(TLEHistory.epoch))
+            .join(Satellite, Satellite.id == TLEHistory.satellite_id)
+            .filter(Satellite.constellation_id == constellation.id)
+            .group_by(TLEHistory.satellite_id)
+            .all()
+        )
+        
         # Find satellites needing history and determine their required date ranges
         satellites_needing_history = []
         
         for sat in satellites:
-            # Find the oldest TLE we have for this satellite
-            oldest_record = TLEHistory.query.filter_by(satellite_id=sat.id)\
-                .order_by(TLEHistory.epoch.asc()).first()
+            oldest_epoch = oldest_epochs.get(sat.id)
             
-            if oldest_record:
+            if oldest_epoch:
                 # We have some history - check if we need more
-                if oldest_record.epoch > target_start + timedelta(days=7):
-                    # Need to fill gap from target_start to oldest_record.epoch
+                if oldest_epoch > target_start + timedelta(days=7):
+                    # Need to fill gap from target_start to oldest_epoch
                     satellites_needing_history.append({
                         'satellite': sat,
                         'fetch_start': target_start,
-                        'fetch_end': oldest_record.epoch - timedelta(days=1),
+                        'fetch_end': oldest_epoch - timedelta(days=1),
                         'has_some_history': True
                     })
             else:
@@ -675,38 +984,50 @@ class TLEService:
         """
         Fetch history in time chunks to avoid overwhelming the API.
         
-        Downloads history in HISTORY_CHUNK_DAYS increments.
+        Downloads history in HISTORY_CHUNK_DAYS increments. Chunk requests
+        start HISTORY_DELAY_BETWEEN_CHUNKS apart, but up to
+        HISTORY_CHUNK_WORKERS can be downloading at once, so a slow response
+        no longer delays the next chunk.
         """
-        all_records = []
+        chunks = []
         current_start = start_date
-        
         while current_start < end_date:
             # Calculate chunk end (either HISTORY_CHUNK_DAYS from start or end_date)
             chunk_end = min(current_start + timedelta(days=self.HISTORY_CHUNK_DAYS), end_date)
-            
-            print(f"[TLEService] Fetching chunk: {current_start.date()} to {chunk_end.date()}", flush=True)
+            chunks.append((current_start, chunk_end))
+            current_start = chunk_end
+        
+        def fetch_chunk(chunk_start: datetime, chunk_end: datetime) -> List[Dict]:
+            print(f"[TLEService] Fetching chunk: {chunk_start.date()} to {chunk_end.date()}", flush=True)
             
             try:
                 records = spacetrack_service.get_gp_history(
                     norad_ids,
-                    start_date=current_start,
+                    start_date=chunk_start,
                     end_date=chunk_end,
                     constellation=constellation
                 )
                 
                 if records:
-                    all_records.extend(records)
                     print(f"[TLEService] Chunk returned {len(records)} records", flush=True)
+                    return records
                     
             except Exception as e:
                 print(f"[TLEService] Chunk fetch error: {e}", flush=True)
+            return []
+        
+        with ThreadPoolExecutor(max_workers=self.HISTORY_CHUNK_WORKERS) as executor:
+            futures = []
+            for i, (chunk_start, chunk_end) in enumerate(chunks):
+                # Delay between time chunk requests
+                if i:
+                    time.sleep(self.HISTORY_DELAY_BETWEEN_CHUNKS)
+                futures.append(executor.submit(fetch_chunk, chunk_start, chunk_end))
             
-            # Move to next chunk
-            current_start = chunk_end
-            
-            # Delay between time chunks
-            if current_start < end_date:
-                time.sleep(self.HISTORY_DELAY_BETWEEN_CHUNKS)
+            # Keep records in chunk order
+            all_records = []
+            for future in futures:
+                all_records.extend(future.result())
         
         return all_records
     
@@ -728,8 +1049,8 @@ class TLEService:
         if not constellation:
             return {'error': 'Constellation not found'}
         
-        satellites = Satellite.query.filter_by(constellation_id=constellation.id).all()
-        if not satellites:
+        total = Satellite.query.filter_by(constellation_id=constellation.id).count()
+        if not total:
             return {'error': 'No satellites in constellation', 'total': 0}
         
         now = datetime.utcnow()
@@ -738,37 +1059,32 @@ class TLEService:
         # Separate tracking for cloud storage (pre-2026) and API (2026+)
         cloud_complete = 0  # Has data before 2026
         api_complete = 0    # Has data from 2026 onwards
-        has_any_history = 0
-        none = 0
         
         total_history_records = 0
         
-        for sat in satellites:
-            history_count = TLEHistory.query.filter_by(satellite_id=sat.id).count()
+        # Record count, oldest and newest epoch per satellite in one grouped query
+        history_stats = (
+            db.session.query(func.count(TLEHistory.id), func.min(TLEHistory.epoch),
+                             func.max(TLEHistory.epoch))
+            .join(Satellite, Satellite.id == TLEHistory.satellite_id)
+            .filter(Satellite.constellation_id == constellation.id)
+            .group_by(TLEHistory.satellite_id)
+            .all()
+        )
+        
+        for history_count, oldest_epoch, newest_epoch in history_stats:
             total_history_records += history_count
             
-            if history_count == 0:
-                none += 1
-            else:
-                has_any_history += 1
-                
-                # Check oldest record (cloud storage completeness)
-                oldest = TLEHistory.query.filter_by(satellite_id=sat.id)\
-                    .order_by(TLEHistory.epoch.asc()).first()
-                
-                # Check newest record (API completeness)
-                newest = TLEHistory.query.filter_by(satellite_id=sat.id)\
-                    .order_by(TLEHistory.epoch.desc()).first()
-                
-                # Cloud storage complete if we have data from before 2026
-                if oldest and oldest.epoch < self.HISTORY_API_START_DATE:
-                    cloud_complete += 1
-                
-                # API complete if we have recent data (within last 7 days)
-                if newest and newest.epoch > now - timedelta(days=7):
-                    api_complete += 1
+            # Cloud storage complete if we have data from before 2026
+            if oldest_epoch < self.HISTORY_API_START_DATE:
+                cloud_complete += 1
+            
+            # API complete if we have recent data (within last 7 days)
+            if newest_epoch > now - timedelta(days=7):
+                api_complete += 1
         
-        total = len(satellites)
+        has_any_history = len(history_stats)
+        none = total - has_any_history
         
         # Calculate overall progress
         # Cloud data weight: 80% (bulk of historical data)
@@ -804,11 +1120,18 @@ class TLEService:
 
     def _save_history_data(self, history_data: List[Dict], 
                            satellites: List[Satellite]) -> int:
-        """Save historical TLE data to database."""
+        """
+        Save historical TLE data to database.
+        
+        Rows are bulk inserted; (satellite_id, epoch) pairs that are already
+        stored are skipped by the database via the unique index.
+        """
         count = 0
         sat_map = {s.norad_id: s for s in satellites}
         
         try:
+            mappings = []
+            seen = set()
             for record in history_data:
                 norad_id = record.get('NORAD_CAT_ID')
                 if not norad_id:
@@ -823,37 +1146,16 @@ class TLEService:
                 if not epoch:
                     continue
                 
-                # Check for duplicates
-                exists = TLEHistory.query.filter_by(
-                    satellite_id=satellite.id,
-                    epoch=epoch
-                ).first()
+                # Duplicates within this batch; stored ones are skipped by the insert
+                if (satellite.id, epoch) in seen:
+                    continue
+                seen.add((satellite.id, epoch))
                 
-                if not exists:
-                    mean_motion = float(record.get('MEAN_MOTION', 0))
-                    period_minutes = 1440.0 / mean_motion if mean_motion > 0 else None
-                    
-                    history = TLEHistory(
-                        satellite_id=satellite.id,
-                        tle_line1=record.get('TLE_LINE1'),
-                        tle_line2=record.get('TLE_LINE2'),
-                        epoch=epoch,
-                        source='SpaceTrack_Backfill',
-                        semi_major_axis_km=float(record.get('SEMIMAJOR_AXIS', 0)),
-                        mean_motion=mean_motion,
-                        eccentricity=float(record.get('ECCENTRICITY', 0)),
-                        inclination=float(record.get('INCLINATION', 0)),
-                        apogee_km=float(record.get('APOAPSIS', 0)),
-                        perigee_km=float(record.get('PERIAPSIS', 0)),
-                        period_minutes=period_minutes,
-                        bstar=float(record.get('BSTAR', 0)),
-                        mean_anomaly=float(record.get('MEAN_ANOMALY', 0)),
-                        raan=float(record.get('RA_OF_ASC_NODE', 0)),
-                        arg_of_perigee=float(record.get('ARG_OF_PERICENTER', 0)),
-                    )
-                    db.session.add(history)
-                    count += 1
+                mappings.append(
+                    self._history_mapping(satellite.id, record, epoch, 'SpaceTrack_Backfill')
+                )
             
+            count = self._insert_history_rows(mappings)
             db.session.commit()
             print(f"[TLEService] Saved {count} history records")
             
@@ -917,14 +1219,9 @@ class TLEService:
         constellation = Constellation.query.filter_by(slug=constellation_slug).first()
         
         if constellation:
-            query = Satellite.query.filter_by(constellation_id=constellation.id)
-            
-            if active_only:
-                query = query.filter_by(is_active=True)
-                
-            satellites = query.all()
+            satellites = self._query_tle_dicts(constellation.id, active_only)
             if satellites:
-                return [sat.to_tle_dict() for sat in satellites]
+                return satellites
         
         # Auto-fetch if enabled and data missing
         if auto_fetch and constellation_slug in self.constellations:
@@ -934,31 +1231,58 @@ class TLEService:
                 
                 constellation = Constellation.query.filter_by(slug=constellation_slug).first()
                 if constellation:
-                    query = Satellite.query.filter_by(constellation_id=constellation.id)
-                    if active_only:
-                        query = query.filter_by(is_active=True)
-                    satellites = query.all()
-                    return [sat.to_tle_dict() for sat in satellites]
+                    return self._query_tle_dicts(constellation.id, active_only)
             except Exception as e:
                 print(f"[TLEService] Auto-fetch error: {e}")
         
         return []
 
-    def get_all_tle(self) -> List[Dict]:
-        """Get TLE data for all satellites."""
-        satellites = Satellite.query.all()
-        return [sat.to_tle_dict() for sat in satellites]
+    def get_all_tle(self, constellation_id: Optional[int] = None) -> List[Dict]:
+        """Get TLE data for all satellites, optionally for one constellation."""
+        return self._query_tle_dicts(constellation_id)
+
+    def _query_tle_dicts(self, constellation_id: Optional[int] = None,
+                         active_only: bool = False) -> List[Dict]:
+        """
+        Build Satellite.to_tle_dict() shaped dicts straight from the four
+        TLE columns, streamed in chunks without constructing ORM objects.
+        """
+        query = db.session.query(
+                Satellite.name, Satellite.norad_id, Satellite.tle_line1, Satellite.tle_line2
+            )
+        if constellation_id is not None:
+            query = query.filter_by(constellation_id=constellation_id)
+        if active_only:
+            query = query.filter_by(is_active=True)
+        
+        return [
+            {'name': name, 'norad_id': norad_id, 'line1': line1, 'line2': line2}
+            for name, norad_id, line1, line2 in query.yield_per(1000)
+        ]
 
     def update_all_constellations(self) -> Dict[str, Tuple[int, int]]:
-        """Update TLE data for all configured constellations."""
+        """
+        Update TLE data for all configured constellations.
+        
+        Space-Track fetches overlap on a small thread pool (pacing still comes
+        from the per-constellation rate limit and SpaceTrackService); results
+        are stored one constellation at a time in the caller's session.
+        """
         results = {}
         
-        for slug in self.constellations:
-            try:
-                results[slug] = self.update_constellation_tle(slug)
-            except Exception as e:
-                print(f"[TLEService] Error updating {slug}: {e}")
-                results[slug] = (0, 0)
+        with ThreadPoolExecutor(max_workers=self.UPDATE_MAX_WORKERS) as executor:
+            futures = {
+                slug: executor.submit(self._fetch_constellation_gp, slug)
+                for slug in self.constellations
+            }
+            
+            for slug, future in futures.items():
+                try:
+                    gp_data = future.result()
+                    results[slug] = self._apply_constellation_gp(slug, gp_data) if gp_data else (0, 0)
+                except Exception as e:
+                    print(f"[TLEService] Error updating {slug}: {e}")
+                    results[slug] = (0, 0)
         
         return results
 
@@ -969,6 +1293,16 @@ class TLEService:
         if not epoch_str:
             return None
 
+        # Canonical 'YYYY-MM-DDTHH:MM:SS[.ffffff]' epochs (virtually all
+        # records) go through the C ISO parser, much cheaper than strptime
+        if (len(epoch_str) == 19 or (len(epoch_str) == 26 and epoch_str[19] == '.'
+                                     and epoch_str[20:].isdigit())) \
+                and epoch_str[10] == 'T' and epoch_str[13] == epoch_str[16] == ':':
+            try:
+                return datetime.fromisoformat(epoch_str)
+            except ValueError:
+                pass  # Let strptime decide on unusual padding
+        
         try:
             if '.' in epoch_str:
                 return datetime.strptime(epoch_str, '%Y-%m-%dT%H:%M:%S.%f')
@@ -977,54 +1311,62 @@ class TLEService:
         except ValueError:
             return None
 
+    def _parse_date(self, date_str: str) -> date:
+        """
+        Parse a 'YYYY-MM-DD' date (SATCAT LAUNCH/DECAY, GP DECAY_DATE).
+        
+        Raises:
+            ValueError: Same cases as strptime with '%Y-%m-%d'
+        """
+        if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+            try:
+                return date.fromisoformat(date_str)
+            except ValueError:
+                pass  # Let strptime decide on unusual padding
+        return datetime.strptime(date_str, '%Y-%m-%d').date()
+
     def parse_tle_epoch(self, line1: str) -> Optional[datetime]:
         """Parse epoch from TLE line 1 format."""
-        try:
-            epoch_str = line1[18:32].strip()
-            year_2digit = int(epoch_str[:2])
-            day_fraction = float(epoch_str[2:])
-
-            year = 2000 + year_2digit if year_2digit < 57 else 1900 + year_2digit
-            
-            return datetime(year, 1, 1) + timedelta(days=day_fraction - 1)
-        except (ValueError, IndexError):
-            return None
+        # Keyed on the epoch field only; repeated TLE dumps share epochs
+        return _epoch_from_field(line1[18:32].strip())
 
     def parse_tle_text(self, tle_text: str) -> List[Dict]:
         """Parse raw TLE text into structured list."""
         lines = [line.strip() for line in tle_text.strip().split("\n") if line.strip()]
-        tle_dict = {}
         
+        # Collect (name, line1, line2) triples first so orbital parameters
+        # can be computed for the whole batch at once
+        triples = []
         i = 0
         while i < len(lines) - 2:
             if lines[i + 1].startswith("1 ") and lines[i + 2].startswith("2 "):
-                name = lines[i].strip()
-                line1 = lines[i + 1].strip()
-                line2 = lines[i + 2].strip()
-                
-                norad_id = self._parse_norad_id(line1)
-                epoch = self.parse_tle_epoch(line1)
-                orbital_params = self._calculate_orbital_params(line2)
-                
-                if norad_id:
-                    entry = {
-                        "name": name,
-                        "line1": line1,
-                        "line2": line2,
-                        "norad_id": norad_id,
-                        "intl_designator": self._parse_intl_designator(line1),
-                        "epoch": epoch,
-                        **orbital_params,
-                    }
-                    
-                    # Keep entry with most recent epoch
-                    if norad_id not in tle_dict or (epoch and entry.get("epoch", datetime.min) > tle_dict[norad_id].get("epoch", datetime.min)):
-                        tle_dict[norad_id] = entry
-                
+                triples.append((lines[i].strip(), lines[i + 1].strip(), lines[i + 2].strip()))
                 i += 3
             else:
                 i += 1
         
+        all_orbital_params = self._calculate_orbital_params_batch([t[2] for t in triples])
+        tle_dict = {}
+        
+        for (name, line1, line2), orbital_params in zip(triples, all_orbital_params):
+            norad_id = self._parse_norad_id(line1)
+            epoch = self.parse_tle_epoch(line1)
+            
+            if norad_id:
+                entry = {
+                    "name": name,
+                    "line1": line1,
+                    "line2": line2,
+                    "norad_id": norad_id,
+                    "intl_designator": self._parse_intl_designator(line1),
+                    "epoch": epoch,
+                    **orbital_params,
+                }
+                
+                # Keep entry with most recent epoch
+                if norad_id not in tle_dict or (epoch and entry.get("epoch", datetime.min) > tle_dict[norad_id].get("epoch", datetime.min)):
+                    tle_dict[norad_id] = entry
+        
         return list(tle_dict.values())
 
     def _parse_norad_id(self, line1: str) -> Optional[int]:
@@ -1041,18 +1383,64 @@ class TLEService:
         except IndexError:
             return None
 
+    def compute_orbital_elements(self, mean_motion, eccentricity) -> Dict:
+        """
+        Derive period, semi-major axis, apogee and perigee from mean motion
+        and eccentricity as whole-array NumPy operations.
+        
+        Args:
+            mean_motion: Mean motion in rev/day (float or array, non-zero)
+            eccentricity: Eccentricity (float or array of the same length)
+        
+        Returns:
+            Dict of float64 arrays keyed like _calculate_orbital_params
+            (plain floats when both inputs are scalars)
+        """
+        scalar = np.ndim(mean_motion) == 0 and np.ndim(eccentricity) == 0
+        mean_motion = np.atleast_1d(np.asarray(mean_motion, dtype=np.float64))
+        eccentricity = np.atleast_1d(np.asarray(eccentricity, dtype=np.float64))
+        
+        period_minutes = 1440.0 / mean_motion
+        period_seconds = period_minutes * 60
+        
+        # Same operation order as the scalar version, but each result buffer
+        # is updated in place instead of allocating a temporary per step
+        semi_major_axis = self.EARTH_MU_OVER_4PI2 * period_seconds
+        semi_major_axis *= period_seconds
+        np.cbrt(semi_major_axis, out=semi_major_axis)
+        
+        apogee = 1 + eccentricity
+        apogee *= semi_major_axis
+        apogee -= self.EARTH_RADIUS_KM
+        
+        perigee = 1 - eccentricity
+        perigee *= semi_major_axis
+        perigee -= self.EARTH_RADIUS_KM
+        
+        elements = {
+            "period_minutes": period_minutes,
+            "semi_major_axis_km": semi_major_axis,
+            "apogee_km": apogee,
+            "perigee_km": perigee,
+        }
+        if scalar:
+            return {key: values.item() for key, values in elements.items()}
+        return elements
+
     def _calculate_orbital_params(self, line2: str) -> Dict:
         """Calculate orbital parameters from TLE line 2."""
         try:
             inclination = float(line2[8:16].strip())
             eccentricity = float("0." + line2[26:33].strip())
             mean_motion = float(line2[52:63].strip())
+            if not mean_motion:
+                # No orbit to derive; checked up front instead of letting
+                # the division below raise
+                return {}
 
             period_minutes = 1440.0 / mean_motion
             period_seconds = period_minutes * 60
-            semi_major_axis = (
-                self.EARTH_MU * (period_seconds / (2 * math.pi)) ** 2
-            ) ** (1 / 3)
+            semi_major_axis = math.cbrt(self.EARTH_MU_OVER_4PI2 * period_seconds * period_seconds)
 
             apogee = semi_major_axis * (1 + eccentricity) - self.EARTH_RADIUS_KM
             perigee = semi_major_axis * (1 - eccentricity) - self.EARTH_RADIUS_KM
@@ -1069,20 +1457,94 @@ class TLEService:
         except (ValueError, IndexError):
             return {}
 
+    def _calculate_orbital_params_batch(self, line2s: List[str]) -> List[Dict]:
+        """
+        Calculate orbital parameters for many TLE line 2 strings at once.
+        
+        Same results as _calculate_orbital_params per line, with the orbit
+        math done as NumPy array operations. Lines that don't parse cleanly
+        or have zero mean motion are filtered out before the array math and
+        get the same empty dict the scalar version returns.
+        
+        TLEs change about once a day, so results are cached per line 2 and
+        re-parsing the same data only costs a lookup per line.
+        """
+        cache = self._orbital_params
+        results = [None] * len(line2s)
+        parsed = []  # (index, inclination, eccentricity, mean_motion)
+        
+        for i, line2 in enumerate(line2s):
+            cached = cache.get(line2)
+            if cached is not None:
+                results[i] = dict(cached)
+                continue
+            
+            try:
+                inclination = float(line2[8:16].strip())
+                eccentricity = float("0." + line2[26:33].strip())
+                mean_motion = float(line2[52:63].strip())
+            except ValueError:
+                results[i] = {}
+                continue
+            
+            if mean_motion:
+                parsed.append((i, inclination, eccentricity, mean_motion))
+            else:
+                results[i] = {}
+        
+        if not parsed:
+            return results
+        
+        index, inclination, eccentricity, mean_motion = zip(*parsed)
+        elements = self.compute_orbital_elements(
+            np.fromiter(mean_motion, dtype=np.float64, count=len(parsed)),
+            np.fromiter(eccentricity, dtype=np.float64, count=len(parsed)),
+        )
+        
+        # Crude bound: start over rather than track recency per entry
+        if len(cache) + len(parsed) > self.ORBITAL_PARAMS_CACHE_SIZE:
+            cache.clear()
+        
+        for i, incl, e, mm, period, sma, apo, peri in zip(
+                index, inclination, eccentricity, mean_motion,
+                elements["period_minutes"].tolist(), elements["semi_major_axis_km"].tolist(),
+                elements["apogee_km"].tolist(), elements["perigee_km"].tolist()):
+            results[i] = {
+                "inclination": incl,
+                "eccentricity": e,
+                "mean_motion": mm,
+                "period_minutes": period,
+                "semi_major_axis_km": sma,
+                "apogee_km": apo,
+                "perigee_km": peri,
+            }
+            # Callers get copies, so the cached dict is never mutated
+            cache[line2s[i]] = dict(results[i])
+        
+        return results
+
     # ==================== Startup ====================
 
     def startup_check(self):
         """Perform startup integrity check."""
         print("[TLEService] Performing startup check...")
         
-        for slug in self.constellations.keys():
-            constellation = Constellation.query.filter_by(slug=slug).first()
-            if constellation:
-                count = Satellite.query.filter_by(constellation_id=constellation.id).count()
-                if count > 0:
-                    print(f"[TLEService] {slug}: {count} satellites")
-        
-        print("[TLEService] Startup check complete")
+        # One grouped count for every constellation (uses the constellation_id index)
+        counts = dict(
+            db.session.query(Constellation.slug, func.count(Satellite.id))
+            .join(Satellite, Satellite.constellation_id == Constellation.id)
+            .group_by(Constellation.slug)
+            .all()
+        )
+        
+        # Emit the report as one write instead of one print per constellation
+        lines = [
+            f"[TLEService] {slug}: {counts[slug]} satellites"
+            for slug in self.constellations
+            if counts.get(slug, 0) > 0
+        ]
+        lines.append("[TLEService] Startup check complete")
+        print("\n".join(lines))
 
 
 # Singleton instance
@@ -1,7 +1,8 @@
 """
 Utility functions for API responses.
 """
-from flask import jsonify
+import orjson
+from flask import Response, jsonify, stream_with_context
 
 
 def success_response(data=None, message=None, status_code=200):
@@ -70,3 +71,35 @@ def paginated_response(items, total, offset, limit):
         'limit': limit,
         'has_more': offset + len(items) < total,
     }
+
+
+def streamed_json_array(items, chunk_size=500):
+    """
+    Create a streaming JSON array response.
+    
+    Items are serialized with orjson in chunks as the iterable is consumed,
+    so a generator of rows never has to be materialized as one list or
+    one JSON string.
+    
+    Args:
+        items: Iterable of JSON-serializable items
+        chunk_size: Number of items serialized per chunk
+    
+    Returns:
+        Flask streaming response
+    """
+    def generate():
+        yield b'['
+        first = True
+        chunk = []
+        for item in items:
+            chunk.append(orjson.dumps(item))
+            if len(chunk) >= chunk_size:
+                yield (b'' if first else b',') + b','.join(chunk)
+                first = False
+                chunk = []
+        if chunk:
+            yield (b'' if first else b',') + b','.join(chunk)
+        yield b']'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')